@@ -8,7 +8,6 @@ from astroquery.simbad import Simbad
 from astroquery.mast import Catalogs
 from astropy.coordinates import SkyCoord
 from astropy import units as u
-import random
 
 class GeradorAlvosPromissores:
     """Identifica alvos astronômicos promissores para descobertas"""
@@ -16,6 +15,13 @@ class GeradorAlvosPromissores:
     def __init__(self):
         self.simbad = Simbad()
         self.simbad.add_votable_fields('otype', 'ids')
+        self.rng = np.random.default_rng()
+    
+    def _sortear_ids(self, ranges, n_alvos):
+        """Sorteia n_alvos IDs, cada um num range escolhido ao acaso (limites inclusivos)"""
+        limites = np.array(ranges, dtype=np.int64)
+        escolhidos = limites[self.rng.integers(len(limites), size=n_alvos)]
+        return self.rng.integers(escolhidos[:, 0], escolhidos[:, 1], endpoint=True)
     
     def gerar_alvos_kepler(self, n_alvos=10):
         """
@@ -28,8 +34,6 @@ class GeradorAlvosPromissores:
         Returns:
             list: Lista de dicts com informações dos alvos
         """
-        alvos = []
-        
         # KIC IDs promissores (seleção aleatória de ranges menos estudados)
         # Evitar KICs muito conhecidos (< 1000000)
         kic_ranges = [
@@ -38,21 +42,22 @@ class GeradorAlvosPromissores:
             (10000000, 12000000), # Range muito alto (menos estudados)
         ]
         
-        for _ in range(n_alvos):
-            # Escolher range aleatório
-            kic_min, kic_max = random.choice(kic_ranges)
-            kic_id = random.randint(kic_min, kic_max)
-            
-            alvo = {
-                'nome': f'KIC {kic_id}',
+        # Sortear todos os IDs e prioridades de uma vez
+        kic_ids = self._sortear_ids(kic_ranges, n_alvos)
+        prioridades = self.rng.integers(3, 5, size=n_alvos, endpoint=True)
+        
+        return [
+            {
+                'nome': nome,
                 'missao': 'Kepler',
                 'razao': 'KIC de alto número - estatisticamente menos estudado',
-                'prioridade': random.randint(3, 5),
+                'prioridade': prioridade,
                 'dica': 'Use cadência "long" primeiro, depois "short" se detectar algo'
             }
-            alvos.append(alvo)
-        
-        return alvos
+            for nome, prioridade in zip(
+                np.char.add('KIC ', kic_ids.astype(str)).tolist(), prioridades.tolist()
+            )
+        ]
     
     def gerar_alvos_tess(self, n_alvos=10):
         """
@@ -64,28 +69,27 @@ class GeradorAlvosPromissores:
         Returns:
             list: Lista de alvos TESS
         """
-        alvos = []
-        
         # TIC IDs promissores
         tic_ranges = [
             (100000000, 300000000),  # Range médio
             (400000000, 600000000),  # Range alto
         ]
         
-        for _ in range(n_alvos):
-            tic_min, tic_max = random.choice(tic_ranges)
-            tic_id = random.randint(tic_min, tic_max)
-            
-            alvo = {
-                'nome': f'TIC {tic_id}',
+        tic_ids = self._sortear_ids(tic_ranges, n_alvos)
+        prioridades = self.rng.integers(3, 5, size=n_alvos, endpoint=True)
+        
+        return [
+            {
+                'nome': nome,
                 'missao': 'TESS',
                 'razao': 'TIC de alto número - potencialmente pouco estudado',
-                'prioridade': random.randint(3, 5),
+                'prioridade': prioridade,
                 'dica': 'TESS tem dados mais recentes - maior chance de descobertas não publicadas ainda'
             }
-            alvos.append(alvo)
-        
-        return alvos
+            for nome, prioridade in zip(
+                np.char.add('TIC ', tic_ids.astype(str)).tolist(), prioridades.tolist()
+            )
+        ]
     
     def gerar_alvos_variaveis_suspeitas(self):
         """
@@ -140,23 +144,20 @@ class GeradorAlvosPromissores:
             'A': 'Estrelas A têm debris disks - possíveis sistemas planetários jovens'
         }
         
-        alvos = []
-        
         # Gerar alvos aleatórios deste tipo
-        for i in range(n_alvos):
-            kic_id = random.randint(5000000, 12000000)
-            
-            alvo = {
-                'nome': f'KIC {kic_id}',
+        kic_ids = self._sortear_ids([(5000000, 12000000)], n_alvos)
+        
+        return [
+            {
+                'nome': nome,
                 'missao': 'Kepler',
                 'tipo_esperado': f'{tipo}V',
                 'razao': razoes_por_tipo.get(tipo, 'Tipo estelar interessante'),
                 'prioridade': 3,
                 'dica': f'Busque por estrelas tipo {tipo} - {razoes_por_tipo.get(tipo, "")}'
             }
-            alvos.append(alvo)
-        
-        return alvos
+            for nome in np.char.add('KIC ', kic_ids.astype(str)).tolist()
+        ]
     
     def gerar_coordenadas_aleatorias_kepler(self, n_alvos=5):
         """
@@ -167,18 +168,16 @@ class GeradorAlvosPromissores:
             list: Alvos com coordenadas
         """
         # Campo do Kepler: RA ~290-297°, Dec ~40-50°
-        alvos = []
+        ras = self.rng.uniform(290, 297, size=n_alvos)
+        decs = self.rng.uniform(40, 50, size=n_alvos)
         
-        for i in range(n_alvos):
-            ra = random.uniform(290, 297)
-            dec = random.uniform(40, 50)
-            
-            # Converter para sexagesimal
-            coord = SkyCoord(ra=ra*u.degree, dec=dec*u.degree, frame='icrs')
-            ra_str = coord.ra.to_string(unit=u.hour, sep=':', precision=2)
-            dec_str = coord.dec.to_string(unit=u.degree, sep=':', precision=2)
-            
-            alvo = {
+        # Converter para sexagesimal (um único SkyCoord com todas as coordenadas)
+        coords = SkyCoord(ra=ras*u.degree, dec=decs*u.degree, frame='icrs')
+        ra_strs = coords.ra.to_string(unit=u.hour, sep=':', precision=2)
+        dec_strs = coords.dec.to_string(unit=u.degree, sep=':', precision=2)
+        
+        return [
+            {
                 'nome': f'Coord_{i+1}',
                 'coordenadas': f'{ra_str} {dec_str}',
                 'ra': ra,
@@ -188,9 +187,10 @@ class GeradorAlvosPromissores:
                 'prioridade': 4,
                 'dica': 'Use estas coordenadas diretamente na busca'
             }
-            alvos.append(alvo)
-        
-        return alvos
+            for i, (ra, dec, ra_str, dec_str) in enumerate(
+                zip(ras.tolist(), decs.tolist(), ra_strs.tolist(), dec_strs.tolist())
+            )
+        ]
     
     def gerar_lista_completa(self, incluir_tess=True):
         """
@@ -3,33 +3,27 @@ Interface Web - Análise de Dados Cósmicos
 Sistema profissional com dados REAIS do Kepler/TESS
 """
 
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import streamlit as st
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-import lightkurve as lk
-from plotly.subplots import make_subplots
 
 # Imports principais (manter leve)
-# Módulos pesados serão carregados apenas quando necessário
+# Módulos pesados (plotly, lightkurve) são carregados apenas quando necessário
 from celestial_detector import CelestialBodyDetector
 from stellar_seismology import StellarSeismologyAnalyzer
 
 # Lazy loading para módulos pesados
-_db = None
 _simbad = None
-_cds_pro = None
-_sonificador = None
 _gerador_alvos = None
 _exoplanet_api = None
 
+@st.cache_resource
 def get_database():
-    global _db
-    if _db is None:
-        from database import CelestialDatabase
-        _db = CelestialDatabase()
-    return _db
+    from database import CelestialDatabase
+    return CelestialDatabase()
 
 def get_exoplanet_api():
     global _exoplanet_api
@@ -45,19 +39,15 @@ def get_simbad_checker():
         _simbad = SimbadChecker(radius_arcmin=2.0)
     return _simbad
 
+@st.cache_resource
 def get_cds_checker():
-    global _cds_pro
-    if _cds_pro is None:
-        from cds_professional import CDSProfessionalChecker
-        _cds_pro = CDSProfessionalChecker(radius_arcsec=120)
-    return _cds_pro
+    from cds_professional import CDSProfessionalChecker
+    return CDSProfessionalChecker(radius_arcsec=120)
 
+@st.cache_resource
 def get_sonificador():
-    global _sonificador
-    if _sonificador is None:
-        from sonificador import SonificadorEstelar
-        _sonificador = SonificadorEstelar()
-    return _sonificador
+    from sonificador import SonificadorEstelar
+    return SonificadorEstelar()
 
 def get_gerador_alvos():
     global _gerador_alvos
@@ -195,6 +185,8 @@ st.markdown("""
 @st.cache_data(ttl=7200, show_spinner=False, max_entries=5)
 def buscar_estrela(nome_estrela, missao, cadencia):
     """Busca dados de estrela no Kepler/TESS e retorna arrays numpy + coordenadas"""
+    import lightkurve as lk
+    
     try:
         search_result = lk.search_lightcurve(nome_estrela, author=missao, cadence=cadencia)
         if len(search_result) == 0:
@@ -215,48 +207,183 @@ def buscar_estrela(nome_estrela, missao, cadencia):
     except Exception as e:
         return None, None, None, None, str(e)
 
-@st.cache_data(show_spinner=False)
-def analisar_planetas(time, flux):
+# As análises recebem os arrays com prefixo "_" (o Streamlit não os re-hasheia a
+# cada chamada) e são indexadas pelo hash da curva de luz calculado uma única vez
+@st.cache_data(show_spinner=False, max_entries=16)
+def analisar_planetas(lc_hash, _time, _flux, flux_stats=None):
     """Analisa dados para detectar planetas"""
     detector = CelestialBodyDetector(sensitivity=5.0)
-    planets = detector.detect_transiting_planets(time, flux, min_period=0.5, max_period=50.0)
+    planets = detector.detect_transiting_planets(
+        _time, _flux, min_period=0.5, max_period=50.0, flux_stats=flux_stats
+    )
     return planets
 
-@st.cache_data(show_spinner=False)
-def analisar_cometas(time, flux):
+@st.cache_data(show_spinner=False, max_entries=16)
+def analisar_cometas(lc_hash, _time, _flux, flux_stats=None):
     """Analisa dados para detectar cometas"""
     detector = CelestialBodyDetector(sensitivity=3.0)
-    comets = detector.detect_comets(time, flux)
+    comets = detector.detect_comets(_time, _flux, flux_stats=flux_stats)
     return comets
 
-@st.cache_data(show_spinner=False)
-def analisar_meteoros(time, flux):
+@st.cache_data(show_spinner=False, max_entries=16)
+def analisar_meteoros(lc_hash, _time, _flux, flux_stats=None):
     """Analisa dados para detectar meteoros e eventos rápidos"""
     detector = CelestialBodyDetector(sensitivity=4.0)
-    meteors = detector.detect_meteors_and_fast_transients(time, flux)
+    meteors = detector.detect_meteors_and_fast_transients(_time, _flux, flux_stats=flux_stats)
     return meteors
 
-@st.cache_data(show_spinner=False)
-def analisar_transientes(time, flux):
+@st.cache_data(show_spinner=False, max_entries=16)
+def analisar_transientes(lc_hash, _time, _flux, flux_stats=None):
     """Analisa eventos transientes (supernovas, flares)"""
     detector = CelestialBodyDetector(sensitivity=3.0)
     # Converter fluxo para magnitude (aproximado)
-    mag = -2.5 * np.log10(flux / np.median(flux))
-    transients = detector.detect_transient_events(time, mag)
+    flux_median = flux_stats['median'] if flux_stats else np.median(_flux)
+    # Divisão, log10 e escala no mesmo buffer (um único array alocado)
+    mag = np.divide(_flux, flux_median, dtype=np.float64)
+    np.log10(mag, out=mag)
+    mag *= -2.5
+    transients = detector.detect_transient_events(_time, mag)
     return transients
 
-@st.cache_data(show_spinner=False)
-def analisar_vibrações(time, flux, cadence):
+COLUNAS_MODOS = ('frequency_uHz', 'amplitude', 'mode_order', 'degree', 'type')
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def analisar_vibrações(lc_hash, _time, _flux, cadence, flux_stats=None):
     """Analisa vibrações estelares"""
     seismo = StellarSeismologyAnalyzer()
-    analysis = seismo.analyze_stellar_vibrations(time, flux, cadence=cadence)
+    analysis = seismo.analyze_stellar_vibrations(
+        _time, _flux, cadence=cadence, flux_stats=flux_stats
+    )
+    # Modos em formato colunar (um DataFrame) em vez de lista de dicts; colunas
+    # explícitas evitam a inferência registro a registro e valem para lista vazia
+    analysis['oscillation_modes'] = pd.DataFrame.from_records(
+        analysis['oscillation_modes'], columns=COLUNAS_MODOS
+    )
     return analysis
 
+def obter_analise(nome, funcao, lc_hash, *args):
+    """
+    Reaproveita o resultado de uma análise já feita nesta sessão para a mesma
+    curva de luz (sem re-hash nem desserialização do cache do Streamlit)
+    """
+    if st.session_state.get('analises_hash') != lc_hash:
+        st.session_state['analises_hash'] = lc_hash
+        st.session_state['analises'] = {}
+    analises = st.session_state['analises']
+    if nome not in analises:
+        analises[nome] = funcao(lc_hash, *args)
+    return analises[nome]
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def gerar_audio_curva(lc_hash, _time, _flux, duracao):
+    """Sonifica a curva de luz e retorna os bytes WAV"""
+    audio_data, sample_rate = get_sonificador().sonificar_curva_luz(
+        _time, _flux, duracao_segundos=duracao
+    )
+    return get_sonificador().criar_wav_bytes(audio_data, sample_rate)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def gerar_audio_vibracoes(lc_hash, cadence, _frequencies, _power, duracao):
+    """Sonifica o espectro de vibrações e retorna os bytes WAV"""
+    audio_vibr, sr_vibr = get_sonificador().sonificar_vibracoes(
+        _frequencies, _power, duracao_segundos=duracao
+    )
+    return get_sonificador().criar_wav_bytes(audio_vibr, sr_vibr)
+
+def dobrar_curva_fase(time, flux, period, nbins=500):
+    """Dobra a curva de luz no período e faz a média do fluxo em bins de fase (O(N), sem ordenação)"""
+    phase = (time % period) / period
+    bins = np.minimum((phase * nbins).astype(np.int32), nbins - 1)
+    soma = np.bincount(bins, weights=flux, minlength=nbins)
+    contagem = np.bincount(bins, minlength=nbins)
+    
+    # Centro de cada bin; bins sem pontos são descartados
+    centros = (np.arange(nbins) + 0.5) / nbins
+    preenchidos = contagem > 0
+    return centros[preenchidos], soma[preenchidos] / contagem[preenchidos]
+
+def reduzir_lttb(x, y, n_out=3000):
+    """Reduz uma série para n_out pontos com Largest-Triangle-Three-Buckets (preserva a forma visual)"""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+    
+    # Primeiro e último pontos são mantidos; o resto é dividido em n_out - 2 buckets
+    bordas = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        ini, fim = bordas[i], bordas[i + 1]
+        prox_fim = bordas[i + 2] if i + 2 < len(bordas) else n
+        
+        # Vértice C: média do próximo bucket
+        cx = x[fim:prox_fim].mean()
+        cy = y[fim:prox_fim].mean()
+        
+        # Escolher o ponto do bucket que forma o maior triângulo com A e C
+        area = np.abs((x[a] - cx) * (y[ini:fim] - y[a]) - (x[a] - x[ini:fim]) * (cy - y[a]))
+        a = ini + int(np.argmax(area))
+        indices[i + 1] = a
+    
+    return x[indices], y[indices]
+
+def converter_sexagesimal(ras, decs):
+    """Converte RA/Dec em graus para textos h/m/s e °/'/" (todas as coordenadas de uma vez)"""
+    ras = np.asarray(ras, dtype=float)
+    decs = np.asarray(decs, dtype=float)
+    
+    ra_h, resto = np.divmod(ras / 15, 1)
+    ra_m, resto = np.divmod(resto * 60, 1)
+    ra_s = resto * 60
+    
+    dec_d, resto = np.divmod(np.abs(decs), 1)
+    dec_m, resto = np.divmod(resto * 60, 1)
+    dec_s = resto * 60
+    
+    ra_hms = np.char.add(
+        np.char.add(np.char.mod('%02dh ', ra_h.astype(int)), np.char.mod('%02dm ', ra_m.astype(int))),
+        np.char.mod('%05.2fs', ra_s)
+    )
+    dec_dms = np.char.add(
+        np.char.add(np.where(decs >= 0, '+', '-'), np.char.mod('%02d° ', dec_d.astype(int))),
+        np.char.add(np.char.mod("%02d' ", dec_m.astype(int)), np.char.mod('%05.2f"', dec_s))
+    )
+    return ra_hms.tolist(), dec_dms.tolist()
+
+def reduzir_maximo(x, y, n_out=2000):
+    """Reduz uma série para n_out bins de mesma largura guardando o máximo de cada um (preserva a altura dos picos)"""
+    n = len(x)
+    if n <= n_out:
+        return x, y
+    
+    inicios = np.linspace(0, n, n_out, endpoint=False).astype(np.int64)
+    fins = np.append(inicios[1:], n)
+    
+    # Centro de cada bin no eixo x e máximo de y dentro dele
+    return (x[inicios] + x[fins - 1]) / 2, np.maximum.reduceat(y, inicios)
+
+@st.cache_resource
+def figura_base_espectro():
+    """Layout do espectro de potência (template resolvido uma vez); nunca alterar, só copiar"""
+    import plotly.graph_objects as go
+    return go.Figure(layout=dict(
+        template='plotly_dark',
+        xaxis_title="Frequência (μHz)",
+        yaxis_title="Potência",
+        height=400,
+        showlegend=False
+    ))
+
 def criar_mapa_ceu(ra, dec, nome_estrela):
     """Cria mapa do céu mostrando localização do objeto (estilo SIMBAD)"""
     if ra is None or dec is None:
         return None
     
+    import plotly.graph_objects as go
+    
     # Criar grade de coordenadas ao redor do objeto (raio de 5 graus)
     ra_min, ra_max = ra - 5, ra + 5
     dec_min, dec_max = dec - 5, dec + 5
@@ -374,9 +501,50 @@ def criar_mapa_ceu(ra, dec, nome_estrela):
     
     return fig
 
+def _sem_erro(resultado, partes=()):
+    """
+    Devolve o resultado de uma consulta de catálogo, ou levanta RuntimeError se
+    ele (ou uma das sub-consultas em partes) falhou
+    
+    st.cache_data não guarda exceções: a falha não fica memorizada e a consulta
+    é repetida no próximo rerun.
+    """
+    for parte in [resultado] + [resultado.get(chave) for chave in partes]:
+        if parte and (parte.get('status') == 'ERRO' or 'erro' in parte):
+            raise RuntimeError(parte.get('erro', 'Falha na consulta ao catálogo'))
+    return resultado
+
+# Consultas de catálogo memorizadas entre reruns (coordenadas arredondadas a ~0.04")
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=256)
+def consultar_simbad(ra, dec):
+    """Verificação rápida no SIMBAD para uma coordenada"""
+    return _sem_erro(get_simbad_checker().verificar_coordenadas(ra, dec))
+
+@st.cache_resource(max_entries=256)
+def criar_skycoord(ra, dec):
+    """SkyCoord ICRS de uma coordenada, construído uma vez e reaproveitado entre reruns"""
+    from astropy.coordinates import SkyCoord
+    from astropy import units as u
+    return SkyCoord(ra=ra*u.degree, dec=dec*u.degree, frame='icrs')
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=256)
+def consultar_simbad_cds(ra, dec):
+    """Cone SIMBAD completo (astroquery) para uma coordenada"""
+    return _sem_erro(get_cds_checker().verificar_simbad_completo(ra, dec, coord=criar_skycoord(ra, dec)))
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=256)
+def consultar_cds(ra, dec, tipo_deteccao, _resultado_simbad=None):
+    """Verificação CDS profissional (VizieR + classificação) reaproveitando o cone SIMBAD"""
+    return _sem_erro(get_cds_checker().verificacao_completa(
+        ra, dec, tipo_deteccao=tipo_deteccao, resultado_simbad=_resultado_simbad,
+        coord=criar_skycoord(ra, dec)
+    ), partes=('simbad', 'exoplanetas', 'variaveis', 'transientes'))
+
 def verificar_novidade(planetas, cometas, meteoros, nome_estrela, ra=None, dec=None, modo='rapido'):
     """Analisa se as detecções podem ser descobertas novas (com verificação SIMBAD ou CDS profissional)"""
     descobertas_potenciais = []
+    # (descoberta, tipo_deteccao para o CDS, confiança em %)
+    pendentes = []
     
     # Determinar qual verificador usar
     usar_cds_pro = (modo == 'profissional' and ra is not None and dec is not None)
@@ -398,28 +566,7 @@ def verificar_novidade(planetas, cometas, meteoros, nome_estrela, ra=None, dec=N
                     'simbad': None,
                     'cds_profissional': None
                 }
-                
-                # Verificar no SIMBAD/CDS
-                if ra is not None and dec is not None:
-                    try:
-                        if usar_cds_pro:
-                            # Modo profissional
-                            resultado_cds = get_cds_checker().verificacao_completa(ra, dec, tipo_deteccao='planeta')
-                            descoberta['cds_profissional'] = resultado_cds
-                            descoberta['status'] = resultado_cds['classificacao_final']['status']
-                            descoberta['prioridade'] = resultado_cds['classificacao_final']['prioridade']
-                            descoberta['recomendacao_simbad'] = resultado_cds['classificacao_final']['mensagem']
-                        else:
-                            # Modo rápido
-                            resultado_simbad = get_simbad_checker().verificar_coordenadas(ra, dec)
-                            classificacao = get_simbad_checker().classificar_descoberta(resultado_simbad, p['confidence'])
-                            descoberta['simbad'] = resultado_simbad
-                            descoberta['status'] = classificacao['status']
-                            descoberta['prioridade'] = classificacao['prioridade']
-                            descoberta['recomendacao_simbad'] = classificacao['recomendacao']
-                    except Exception as e:
-                        descoberta['simbad_erro'] = str(e)
-                
+                pendentes.append((descoberta, 'planeta', p['confidence']))
                 descobertas_potenciais.append(descoberta)
     
     # Verificar cometas
@@ -435,67 +582,96 @@ def verificar_novidade(planetas, cometas, meteoros, nome_estrela, ra=None, dec=N
                     'simbad': None,
                     'cds_profissional': None
                 }
-                
-                # Verificar no SIMBAD/CDS
-                if ra is not None and dec is not None:
-                    try:
-                        if usar_cds_pro:
-                            resultado_cds = get_cds_checker().verificacao_completa(ra, dec, tipo_deteccao='variavel')
-                            descoberta['cds_profissional'] = resultado_cds
-                            descoberta['status'] = resultado_cds['classificacao_final']['status']
-                            descoberta['prioridade'] = resultado_cds['classificacao_final']['prioridade']
-                            descoberta['recomendacao_simbad'] = resultado_cds['classificacao_final']['mensagem']
-                        else:
-                            resultado_simbad = get_simbad_checker().verificar_coordenadas(ra, dec)
-                            classificacao = get_simbad_checker().classificar_descoberta(resultado_simbad, c['confidence'] * 100)
-                            descoberta['simbad'] = resultado_simbad
-                            descoberta['status'] = classificacao['status']
-                            descoberta['prioridade'] = classificacao['prioridade']
-                            descoberta['recomendacao_simbad'] = classificacao['recomendacao']
-                    except Exception as e:
-                        descoberta['simbad_erro'] = str(e)
-                
+                pendentes.append((descoberta, 'variavel', c['confidence'] * 100))
                 descobertas_potenciais.append(descoberta)
     
     # Verificar meteoros/transientes
     if meteoros and len(meteoros) > 0:
         eventos_rapidos = [m for m in meteoros if m.get('confidence', 0) > 0.7]
         if len(eventos_rapidos) > 0:
+            confianca_media = np.mean([m.get('confidence', 0) for m in eventos_rapidos]) * 100
             descoberta = {
                 'tipo': 'Eventos Transientes Rápidos',
                 'indice': len(eventos_rapidos),
-                'confianca': np.mean([m.get('confidence', 0) for m in eventos_rapidos]) * 100,
+                'confianca': confianca_media,
                 'parametros': f"{len(eventos_rapidos)} eventos detectados",
                 'status': 'ANALISAR',
                 'simbad': None,
                 'cds_profissional': None
             }
-            
-            # Verificar no SIMBAD/CDS
-            if ra is not None and dec is not None:
-                try:
-                    confianca_media = np.mean([m.get('confidence', 0) for m in eventos_rapidos]) * 100
-                    
-                    if usar_cds_pro:
-                        resultado_cds = get_cds_checker().verificacao_completa(ra, dec, tipo_deteccao='transiente')
-                        descoberta['cds_profissional'] = resultado_cds
-                        descoberta['status'] = resultado_cds['classificacao_final']['status']
-                        descoberta['prioridade'] = resultado_cds['classificacao_final'].get('prioridade', 2)
-                        descoberta['recomendacao_simbad'] = resultado_cds['classificacao_final']['mensagem']
-                    else:
-                        resultado_simbad = get_simbad_checker().verificar_coordenadas(ra, dec)
-                        classificacao = get_simbad_checker().classificar_descoberta(resultado_simbad, confianca_media)
-                        descoberta['simbad'] = resultado_simbad
-                        descoberta['status'] = classificacao['status']
-                        descoberta['prioridade'] = classificacao.get('prioridade', 2)
-                        descoberta['recomendacao_simbad'] = classificacao['recomendacao']
-                except Exception as e:
-                    descoberta['simbad_erro'] = str(e)
-            
+            pendentes.append((descoberta, 'transiente', confianca_media))
             descobertas_potenciais.append(descoberta)
     
+    if ra is None or dec is None or not pendentes:
+        return descobertas_potenciais
+    
+    # Verificar no SIMBAD/CDS: todas as detecções compartilham a coordenada do alvo,
+    # então cada consulta distinta é feita uma única vez, em paralelo (I/O de rede)
+    chave_ra, chave_dec = round(float(ra), 5), round(float(dec), 5)
+    resultados = {}
+    consultas = {}
+    try:
+        if usar_cds_pro:
+            get_cds_checker()
+            # Um único cone SIMBAD serve a todos os tipos; só os catálogos VizieR variam
+            resultado_simbad = consultar_simbad_cds(chave_ra, chave_dec)
+            consultas = {
+                tipo: (consultar_cds, chave_ra, chave_dec, tipo, resultado_simbad)
+                for _, tipo, _ in pendentes
+            }
+        else:
+            get_simbad_checker()
+            consultas = {'simbad': (consultar_simbad, chave_ra, chave_dec)}
+    except Exception as e:
+        # Verificador ou cone SIMBAD indisponível: todas as detecções ficam com o erro
+        chaves = [tipo for _, tipo, _ in pendentes] if usar_cds_pro else ['simbad']
+        resultados = dict.fromkeys(chaves, e)
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futuros = {executor.submit(*args): chave for chave, args in consultas.items()}
+        for futuro in as_completed(futuros):
+            try:
+                resultados[futuros[futuro]] = futuro.result()
+            except Exception as e:
+                resultados[futuros[futuro]] = e
+    
+    for descoberta, tipo_deteccao, confianca in pendentes:
+        resultado = resultados[tipo_deteccao if usar_cds_pro else 'simbad']
+        if isinstance(resultado, Exception):
+            descoberta['simbad_erro'] = str(resultado)
+            continue
+        
+        try:
+            if usar_cds_pro:
+                # Modo profissional
+                descoberta['cds_profissional'] = resultado
+                descoberta['status'] = resultado['classificacao_final']['status']
+                descoberta['prioridade'] = resultado['classificacao_final'].get('prioridade', 2)
+                descoberta['recomendacao_simbad'] = resultado['classificacao_final']['mensagem']
+            else:
+                # Modo rápido
+                classificacao = get_simbad_checker().classificar_descoberta(resultado, confianca)
+                descoberta['simbad'] = resultado
+                descoberta['status'] = classificacao['status']
+                descoberta['prioridade'] = classificacao.get('prioridade', 2)
+                descoberta['recomendacao_simbad'] = classificacao['recomendacao']
+        except Exception as e:
+            descoberta['simbad_erro'] = str(e)
+    
     return descobertas_potenciais
 
+# Consultas do painel de histórico: mudam pouco dentro de uma sessão e são
+# invalidadas explicitamente quando salvar_monitoramento grava algo novo
+@st.cache_data(ttl=30, show_spinner=False)
+def obter_estatisticas():
+    """Estatísticas gerais do banco de dados"""
+    return get_database().estatisticas_gerais()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def obter_descobertas_novas(limit=20):
+    """Últimas descobertas potenciais registradas no banco"""
+    return get_database().listar_descobertas_novas(limit=limit)
+
 def salvar_monitoramento(nome_estrela, resultados, ra, dec):
     """Salva resultados no banco de dados"""
     try:
@@ -526,11 +702,280 @@ def salvar_monitoramento(nome_estrela, resultados, ra, dec):
         if 'descobertas' in resultados and resultados['descobertas']:
             get_database().salvar_descobertas(observacao_id, resultados['descobertas'])
         
+        obter_estatisticas.clear()
+        obter_descobertas_novas.clear()
         return True
     except Exception as e:
         print(f"Erro ao salvar no banco: {e}")
         return False
 
+# Ícone e rótulo exibidos para cada status de verificação
+STATUS_DESCOBERTA = {
+    'NOVA': ("🔴", "POTENCIAL DESCOBERTA!"),
+    'CONHECIDA': ("⚪", "OBJETO CONHECIDO"),
+    'CANDIDATA': ("🟡", "CANDIDATO"),
+}
+
+def rotulo_status(status):
+    """Retorna (ícone, mensagem) para um status de descoberta"""
+    return STATUS_DESCOBERTA.get(status, ("🔵", "ANALISAR"))
+
+@st.fragment
+def mostrar_detalhes_descoberta(descobertas, ra, dec):
+    """Detalhes (SIMBAD/CDS, próximos passos) da descoberta escolhida; trocar a seleção reexecuta só este trecho"""
+    def descrever(i):
+        desc = descobertas[i]
+        status_color, status_msg = rotulo_status(desc['status'])
+        return f"{status_color} {desc['tipo']} #{desc['indice']} - {status_msg} (Prioridade: {desc.get('prioridade', 2)}/5)"
+    
+    # Começar pela descoberta de maior prioridade
+    padrao = max(range(len(descobertas)), key=lambda i: descobertas[i].get('prioridade', 2))
+    escolha = st.selectbox(
+        "Ver detalhes de…",
+        range(len(descobertas)),
+        index=padrao,
+        format_func=descrever,
+        key='descoberta_detalhe'
+    )
+    desc = descobertas[escolha]
+    prioridade = desc.get('prioridade', 2)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Confiança Detecção", f"{desc['confianca']:.1f}%")
+    with col2:
+        st.metric("Status SIMBAD", desc['status'])
+    with col3:
+        st.metric("Prioridade", f"{prioridade}/5")
+    
+    st.info(f"**Parâmetros:** {desc['parametros']}")
+    
+    # Mostrar resultado SIMBAD
+    if 'simbad' in desc and desc['simbad']:
+        st.divider()
+        st.subheader("Verificação SIMBAD (Modo Rápido)")
+        
+        resultado_simbad = desc['simbad']
+        
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            total_objetos = resultado_simbad.get('total_objetos', 0)
+            
+            if total_objetos == 0:
+                st.success("✅ **Nenhum objeto conhecido encontrado nestas coordenadas!**")
+            else:
+                st.warning(f"⚠️ **{total_objetos} objetos encontrados no campo**")
+                
+                obj_principal = resultado_simbad.get('objeto_principal')
+                if obj_principal:
+                    st.markdown(f"""
+**Objeto mais próximo:**
+- **Nome:** {obj_principal.get('identificador', 'N/A')}
+- **Tipo:** {obj_principal.get('tipo', 'N/A')}
+- **Distância:** {obj_principal.get('distancia_arcsec', 0):.2f} arcsec
+- **Referências:** {obj_principal.get('referencias', 0)} papers
+                    """)
+                    
+                    if obj_principal.get('distancia_arcsec', 999) < 5:
+                        st.info("🎯 Objeto muito próximo (< 5 arcsec) - Provavelmente é o mesmo objeto")
+                    elif obj_principal.get('distancia_arcsec', 999) < 30:
+                        st.warning("📍 Objeto moderadamente próximo - Pode ser o mesmo ou campo estelar")
+                    else:
+                        st.success("📍 Objeto distante - Sua detecção pode ser algo novo no campo!")
+        
+        with col2:
+            url_simbad = resultado_simbad.get('url_busca', '')
+            if url_simbad:
+                st.markdown(f"[🔗 Ver no SIMBAD]({url_simbad})")
+    
+    # Mostrar resultado CDS Profissional
+    if 'cds_profissional' in desc and desc['cds_profissional']:
+        st.divider()
+        st.subheader("🎓 Verificação Profissional CDS")
+        
+        resultado_cds = desc['cds_profissional']
+        
+        # Relatório completo
+        relatorio = get_cds_checker().gerar_relatorio_profissional(resultado_cds)
+        st.markdown(relatorio)
+        
+        # Detalhes adicionais: uma tabela por catálogo (ordenável) em vez de markdown por objeto
+        if resultado_cds['simbad']['total_objetos'] > 0:
+            with st.expander("Ver todos os objetos SIMBAD encontrados"):
+                df_objetos = pd.DataFrame.from_records(
+                    resultado_cds['simbad']['objetos'],
+                    columns=['nome', 'tipo', 'separacao_arcsec', 'mag_v', 'referencias']
+                ).rename(columns={
+                    'nome': 'Nome', 'tipo': 'Tipo', 'separacao_arcsec': 'Separação (arcsec)',
+                    'mag_v': 'Mag V', 'referencias': 'Referências'
+                })
+                st.dataframe(df_objetos, use_container_width=True, hide_index=True)
+        
+        # Exoplanetas
+        if resultado_cds['exoplanetas'] and resultado_cds['exoplanetas']['total_planetas'] > 0:
+            with st.expander(f"Ver {resultado_cds['exoplanetas']['total_planetas']} planetas conhecidos"):
+                # Colunas variam por catálogo; valores mascarados do VizieR viram vazios
+                df_planetas = get_cds_checker().dataframe_catalogo(
+                    resultado_cds['exoplanetas']['planetas']
+                )
+                st.dataframe(df_planetas, use_container_width=True, hide_index=True)
+        
+        # Variáveis
+        if resultado_cds['variaveis'] and resultado_cds['variaveis']['total_variaveis'] > 0:
+            with st.expander(f"Ver {resultado_cds['variaveis']['total_variaveis']} estrelas variáveis"):
+                df_variaveis = pd.DataFrame.from_records(
+                    resultado_cds['variaveis']['variaveis'],
+                    columns=['nome', 'tipo', 'periodo', 'max_mag', 'min_mag']
+                ).rename(columns={
+                    'nome': 'Nome', 'tipo': 'Tipo', 'periodo': 'Período (d)',
+                    'max_mag': 'Mag máx', 'min_mag': 'Mag mín'
+                })
+                st.dataframe(df_variaveis, use_container_width=True, hide_index=True)
+    
+    # Recomendação do sistema
+    if 'recomendacao_simbad' in desc:
+        st.divider()
+        if desc['status'] == 'NOVA':
+            st.success(f"**Recomendação:** {desc['recomendacao_simbad']}")
+        elif desc['status'] == 'CONHECIDA':
+            st.info(f"**Análise:** {desc['recomendacao_simbad']}")
+        else:
+            st.warning(f"**Recomendação:** {desc['recomendacao_simbad']}")
+    
+    # Erro na verificação SIMBAD
+    if 'simbad_erro' in desc:
+        st.error(f"⚠️ Erro ao verificar SIMBAD: {desc['simbad_erro']}")
+        st.info("Verifique manualmente no link acima ou tente novamente mais tarde.")
+    
+    # Próximos passos baseado no status
+    if desc['status'] == 'NOVA':
+        st.divider()
+        st.success("### 🎉 POSSÍVEL DESCOBERTA!")
+        
+        st.markdown("### Próximos Passos:")
+        
+        tab1, tab2, tab3 = st.tabs(["Verificação", "Monitoramento", "Publicação"])
+        
+        with tab1:
+            st.markdown("""
+            **Verificações adicionais:**
+            
+            1. ✅ Verificado no SIMBAD - Não encontrado
+            2. 🔍 Verificar em outros catálogos:
+               - NASA Exoplanet Archive
+               - VizieR (catálogos variados)
+               - Minor Planet Center (se for cometa/asteroide)
+            3. 🔍 Buscar em papers recentes (últimos 6 meses)
+            
+            **Se continuar não encontrando = DESCOBERTA CONFIRMADA!**
+            """)
+            
+            if ra is not None and dec is not None:
+                st.code(f"""
+Links para verificação adicional:
+
+NASA Exoplanet Archive:
+https://exoplanetarchive.ipac.caltech.edu/
+
+VizieR:
+https://vizier.u-strasbg.fr/viz-bin/VizieR?-c={ra}+{dec}&-c.rs=2
+
+ArXiv recentes (últimos 6 meses):
+https://arxiv.org/search/?query={ra}+{dec}&searchtype=all&order=-announced_date_first&size=50
+                """)
+        
+        with tab2:
+            st.markdown("""
+            **Continue observando:**
+            
+            - ✓ Faça pelo menos 3 observações em datas diferentes
+            - ✓ Use cadência curta (short) para maior precisão
+            - ✓ Tente outras missões (Kepler + TESS)
+            - ✓ Documente todas as observações
+            
+            O sistema já está salvando automaticamente no banco de dados.
+            """)
+        
+        with tab3:
+            st.markdown("""
+            **Como reportar sua descoberta:**
+            
+            **Para Planetas:**
+            - 📧 NASA Exoplanet Archive
+            - 📧 Exoplanet.eu
+            - 📄 Publicar paper em journals: AJ, ApJ, MNRAS
+            
+            **Para Cometas/Asteroides:**
+            - 📧 Minor Planet Center (MPC)
+            - 📧 Central Bureau for Astronomical Telegrams
+            
+            **Para Transientes (Supernovas):**
+            - 📧 Transient Name Server (TNS)
+            - 📧 AAVSO
+            
+            **Dica:** Aguarde confirmação de pelo menos 3 observações independentes!
+            """)
+    
+    elif desc['status'] == 'CONHECIDA':
+        st.info("""
+        **Validação bem-sucedida!** 
+        
+        Seu sistema detectou corretamente um objeto conhecido, confirmando que:
+        - ✅ Os algoritmos de detecção estão funcionando
+        - ✅ A análise de dados está precisa
+        - ✅ O sistema pode encontrar objetos reais
+        
+        Continue procurando em outras estrelas menos estudadas!
+        """)
+    
+    elif desc['status'] == 'CANDIDATA':
+        st.warning("""
+        **Candidato interessante.** Necessita mais observações para confirmação.
+        
+        **Ações recomendadas:**
+        - Continue monitorando este objeto
+        - Faça mais 2-3 observações
+        - Use diferentes configurações de cadência
+        - Verifique se o padrão se repete
+        """)
+
+# Os painéis de áudio são fragmentos: mexer no slider ou gerar o WAV só
+# re-executa o painel, sem baixar a curva de luz nem refazer as análises
+@st.fragment
+def painel_audio_curva(lc_hash, time, flux, nome_estrela):
+    """Controles de sonificação da curva de luz"""
+    duracao_audio = st.slider("Duração do áudio (s)", 5, 30, 10, key='duracao_curva')
+    if st.button("🎵 Gerar Áudio da Curva de Luz", use_container_width=True):
+        with st.spinner("Gerando áudio..."):
+            audio_bytes = gerar_audio_curva(lc_hash, time, flux, duracao_audio)
+            
+            st.audio(audio_bytes, format='audio/wav')
+            st.download_button(
+                label="⬇️ Baixar Áudio",
+                data=audio_bytes,
+                file_name=f"{nome_estrela}_curva_luz.wav",
+                mime="audio/wav"
+            )
+
+@st.fragment
+def painel_audio_vibracoes(lc_hash, cadence, frequencies, power, nome_estrela):
+    """Controles de sonificação do espectro de vibrações"""
+    duracao_vibr = st.slider("Duração (s)", 5, 20, 10, key='duracao_vibr')
+    if st.button("🎵 Gerar Áudio das Vibrações", use_container_width=True):
+        with st.spinner("Sintetizando frequências estelares..."):
+            audio_vibr_bytes = gerar_audio_vibracoes(
+                lc_hash, cadence, frequencies, power, duracao_vibr
+            )
+            
+            st.audio(audio_vibr_bytes, format='audio/wav')
+            st.download_button(
+                label="⬇️ Baixar Áudio",
+                data=audio_vibr_bytes,
+                file_name=f"{nome_estrela}_vibracoes.wav",
+                mime="audio/wav",
+                key='download_vibr'
+            )
+
 # Título
 st.title("Análise de Dados Astronômicos Reais")
 st.markdown("Sistema de análise usando dados do Kepler e TESS")
@@ -572,7 +1017,7 @@ if st.session_state.get('mostrar_explorador', False):
             'KIC': ['KIC 11904151', 'KIC 6541920', 'KIC 12644769', 'KIC 10593626', 'KIC 9002278', 'KIC 11442793', 'KIC 8120608', 'KIC 9603725', 'KIC 10666592']
         })
         
-        st.dataframe(kepler_planetas, use_container_width=True, hide_index=True)
+        st.table(kepler_planetas.set_index('Nome'))
         
         col1, col2 = st.columns([2, 1])
         with col1:
@@ -604,7 +1049,7 @@ if st.session_state.get('mostrar_explorador', False):
             'TIC': ['TIC 150428135', 'TIC 301256664', 'TIC 259377017', 'TIC 52368076', 'TIC 12422937', 'TIC 87998380', 'TIC 109820622']
         })
         
-        st.dataframe(tess_exemplos, use_container_width=True, hide_index=True)
+        st.table(tess_exemplos.set_index('Nome'))
         
         st.info("💡 **Dica:** TESS tem dados mais recentes! Maior chance de fazer novas descobertas.")
         
@@ -634,8 +1079,9 @@ if st.session_state.get('mostrar_explorador', False):
             ],
             'Missão': ['Kepler', 'Kepler', 'Kepler', 'Kepler/TESS', 'TESS']
         })
+        NOME_TO_MISSAO = dict(zip(famosos['Nome'], famosos['Missão']))
         
-        st.dataframe(famosos, use_container_width=True, hide_index=True)
+        st.table(famosos.set_index('Nome'))
         
         st.warning("⚠️ **ATENÇÃO:** Estes objetos têm comportamento EXTREMO e ÚNICO!")
         
@@ -646,8 +1092,7 @@ if st.session_state.get('mostrar_explorador', False):
             if st.button("🔥 Analisar Caso Famoso", use_container_width=True):
                 st.session_state['nome_estrela_preenchido'] = estrela_famosa
                 # Determinar missão
-                idx = famosos[famosos['Nome'] == estrela_famosa].index[0]
-                st.session_state['missao_selecionada'] = famosos.iloc[idx]['Missão'].split('/')[0]
+                st.session_state['missao_selecionada'] = NOME_TO_MISSAO[estrela_famosa].split('/')[0]
                 st.session_state['mostrar_explorador'] = False
                 st.rerun()
     
@@ -680,9 +1125,7 @@ if st.session_state.get('mostrar_explorador', False):
         else:
             sugestoes = ['MOA-2011-BLG-293', 'OGLE-2016-BLG-1190']
         
-        st.markdown("**Exemplos deste tipo:**")
-        for sug in sugestoes:
-            st.markdown(f"- {sug}")
+        st.markdown("**Exemplos deste tipo:**\n\n" + "\n".join(f"- {sug}" for sug in sugestoes))
         
         nome_busca = st.text_input("Ou digite o nome completo:", key="busca_tipo")
         if st.button("🎯 Buscar Este Objeto", use_container_width=True):
@@ -713,13 +1156,6 @@ with st.sidebar:
     
     st.divider()
     
-    # Seleção de missão
-    missao = st.selectbox(
-        "Missão Espacial",
-        ["Kepler", "TESS"],
-        help="Escolha o telescópio espacial"
-    )
-    
     # Input da estrela
     st.subheader("Buscar Estrela")
     
@@ -727,73 +1163,93 @@ with st.sidebar:
     if st.button("📊 Explorar Dados Disponíveis", use_container_width=True):
         st.session_state['mostrar_explorador'] = True
     
-    # Exemplos rápidos
-    exemplo = st.selectbox(
-        "Exemplos de estrelas",
-        [
-            "Pesquisa personalizada",
-            "Kepler-10 (2 planetas confirmados)",
-            "Kepler-90 (8 planetas!)",
-            "KIC 11904151 (oscilações)",
-            "HD 209458 (Hot Jupiter)",
-            "Kepler-16 (planeta circumbinário)",
-            "Kepler-22 (zona habitável)",
-            "KIC 8462852 (Estrela de Tabby)"
-        ]
-    )
+    # Alvo escolhido no explorador ou nos alvos recomendados pré-preenche o formulário
+    if 'nome_estrela_preenchido' in st.session_state:
+        st.session_state['nome_estrela'] = st.session_state.pop('nome_estrela_preenchido')
+        st.session_state['exemplo'] = "Pesquisa personalizada"
+    if st.session_state.get('missao_selecionada') in ("Kepler", "TESS"):
+        st.session_state['missao'] = st.session_state.pop('missao_selecionada')
+    st.session_state.setdefault('nome_estrela', 'Kepler-10')
+    
+    # Configuração da análise num formulário: mudar opções não dispara reruns,
+    # só o botão de envio roda o pipeline (download, detecções e verificação)
+    with st.form('analise'):
+        # Seleção de missão
+        missao = st.selectbox(
+            "Missão Espacial",
+            ["Kepler", "TESS"],
+            key='missao',
+            help="Escolha o telescópio espacial"
+        )
+        
+        # Exemplos rápidos
+        exemplo = st.selectbox(
+            "Exemplos de estrelas",
+            [
+                "Pesquisa personalizada",
+                "Kepler-10 (2 planetas confirmados)",
+                "Kepler-90 (8 planetas!)",
+                "KIC 11904151 (oscilações)",
+                "HD 209458 (Hot Jupiter)",
+                "Kepler-16 (planeta circumbinário)",
+                "Kepler-22 (zona habitável)",
+                "KIC 8462852 (Estrela de Tabby)"
+            ],
+            key='exemplo'
+        )
+        
+        nome_estrela = st.text_input(
+            "Nome da Estrela",
+            key='nome_estrela',
+            help="Usado quando 'Pesquisa personalizada' está selecionada"
+        )
+        
+        cadencia = st.selectbox(
+            "Cadência",
+            ["long", "short"],
+            help="Long: ~30min, Short: ~1min"
+        )
+        
+        # Análises
+        st.subheader("Tipos de Detecção")
+        detect_planets = st.checkbox("Planetas (trânsitos)", value=True)
+        detect_comets = st.checkbox("Cometas (variação de brilho)", value=False)
+        detect_meteors = st.checkbox("Meteoros (eventos rápidos)", value=False)
+        detect_transients = st.checkbox("Transientes (supernovas/flares)", value=False)
+        detect_seismo = st.checkbox("Asterosismologia (vibrações)", value=False)
+        
+        st.divider()
+        
+        # Opção de verificação profissional
+        st.subheader("Verificação de Descobertas")
+        modo_verificacao = st.radio(
+            "Modo de Verificação",
+            ["Rápido (HTTP)", "Profissional (Astroquery CDS)"],
+            help="Rápido: HTTP direto ao SIMBAD. Profissional: APIs oficiais da CDS (SIMBAD + VizieR + catálogos especializados)"
+        )
+        
+        st.divider()
+        
+        # Opção de monitoramento
+        st.subheader("Monitoramento")
+        enable_monitoring = st.checkbox("Ativar monitoramento", value=True, 
+                                        help="Salva resultados no banco de dados para comparação futura")
+        
+        # Botão de busca
+        buscar = st.form_submit_button("Buscar e Analisar", type="primary", use_container_width=True)
     
     if exemplo != "Pesquisa personalizada":
-        nome_base = exemplo.split(" ")[0]
-        nome_estrela = st.text_input("Nome da Estrela", value=nome_base)
-    else:
-        # Verificar se tem alvo pré-selecionado
-        valor_padrao = st.session_state.get('nome_estrela_preenchido', 'Kepler-10')
-        nome_estrela = st.text_input("Nome da Estrela", value=valor_padrao)
-        
-        # Limpar após uso
-        if 'nome_estrela_preenchido' in st.session_state:
-            del st.session_state['nome_estrela_preenchido']
-    
-    cadencia = st.selectbox(
-        "Cadência",
-        ["long", "short"],
-        help="Long: ~30min, Short: ~1min"
-    )
-    
-    # Análises
-    st.subheader("Tipos de Detecção")
-    detect_planets = st.checkbox("Planetas (trânsitos)", value=True)
-    detect_comets = st.checkbox("Cometas (variação de brilho)", value=False)
-    detect_meteors = st.checkbox("Meteoros (eventos rápidos)", value=False)
-    detect_transients = st.checkbox("Transientes (supernovas/flares)", value=False)
-    detect_seismo = st.checkbox("Asterosismologia (vibrações)", value=False)
-    
-    st.divider()
-    
-    # Opção de verificação profissional
-    st.subheader("Verificação de Descobertas")
-    modo_verificacao = st.radio(
-        "Modo de Verificação",
-        ["Rápido (HTTP)", "Profissional (Astroquery CDS)"],
-        help="Rápido: HTTP direto ao SIMBAD. Profissional: APIs oficiais da CDS (SIMBAD + VizieR + catálogos especializados)"
-    )
-    
-    st.divider()
-    
-    # Opção de monitoramento
-    st.subheader("Monitoramento")
-    enable_monitoring = st.checkbox("Ativar monitoramento", value=True, 
-                                    help="Salva resultados no banco de dados para comparação futura")
+        nome_estrela = exemplo.split(" (")[0]
     
     # Botão para ver histórico
     if st.button("Ver Histórico/Estatísticas", use_container_width=True):
         st.session_state['mostrar_historico'] = True
-    
-    # Botão de busca
-    buscar = st.button("Buscar e Analisar", type="primary", use_container_width=True)
 
 # Área principal
 if buscar:
+    # Plotly só é necessário para exibir resultados (sys.modules cacheia entre reruns)
+    import plotly.graph_objects as go
+    
     with st.spinner(f"Buscando dados de {nome_estrela}..."):
         time, flux, ra, dec, erro = buscar_estrela(nome_estrela, missao, cadencia)
     
@@ -811,13 +1267,28 @@ if buscar:
     time = time[valid_mask]
     flux = flux[valid_mask]
     
-    # Remover outliers básicos
+    # Remover outliers básicos (corte em 5 std: o desvio padrão inclui a variação
+    # dos próprios trânsitos/flares, então eles sobrevivem ao corte)
     flux_median = np.median(flux)
     flux_std = np.std(flux)
     mask = np.abs(flux - flux_median) < 5 * flux_std
     time = time[mask]
     flux = flux[mask]
     
+    # Estatísticas do fluxo limpo: calculadas uma vez por curva de luz e
+    # reaproveitadas por todos os detectores
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(time)
+    hasher.update(flux)
+    lc_hash = hasher.hexdigest()
+    if st.session_state.get('flux_stats_hash') != lc_hash:
+        st.session_state['flux_stats_hash'] = lc_hash
+        st.session_state['flux_stats'] = {
+            'median': float(np.median(flux)),
+            'std': float(np.std(flux))
+        }
+    flux_stats = st.session_state['flux_stats']
+    
     # Informações dos dados
     st.success(f"Dados baixados com sucesso!")
     
@@ -847,18 +1318,11 @@ if buscar:
             st.metric("Declinação (Dec)", f"{dec:.4f}°")
             
             # Converter para coordenadas sexagesimais
-            ra_h = int(ra / 15)
-            ra_m = int((ra / 15 - ra_h) * 60)
-            ra_s = ((ra / 15 - ra_h) * 60 - ra_m) * 60
-            
-            dec_sign = '+' if dec >= 0 else '-'
-            dec_d = int(abs(dec))
-            dec_m = int((abs(dec) - dec_d) * 60)
-            dec_s = ((abs(dec) - dec_d) * 60 - dec_m) * 60
+            (ra_hms,), (dec_dms,) = converter_sexagesimal([ra], [dec])
             
             st.info(f"**Coordenadas (J2000)**\n\n"
-                   f"RA: {ra_h:02d}h {ra_m:02d}m {ra_s:05.2f}s\n\n"
-                   f"Dec: {dec_sign}{dec_d:02d}° {dec_m:02d}' {dec_s:05.2f}\"")
+                   f"RA: {ra_hms}\n\n"
+                   f"Dec: {dec_dms}")
     
     st.divider()
     
@@ -866,7 +1330,7 @@ if buscar:
     st.subheader("Curva de Luz Original")
     
     fig_lc = go.Figure()
-    fig_lc.add_trace(go.Scatter(
+    fig_lc.add_trace(go.Scattergl(
         x=time,
         y=flux,
         mode='lines',
@@ -895,21 +1359,7 @@ if buscar:
         st.info(get_sonificador().descrever_sonificacao('curva_luz'))
     
     with col2:
-        duracao_audio = st.slider("Duração do áudio (s)", 5, 30, 10, key='duracao_curva')
-        if st.button("🎵 Gerar Áudio da Curva de Luz", use_container_width=True):
-            with st.spinner("Gerando áudio..."):
-                audio_data, sample_rate = get_sonificador().sonificar_curva_luz(
-                    time, flux, duracao_segundos=duracao_audio
-                )
-                audio_bytes = get_sonificador().criar_wav_bytes(audio_data, sample_rate)
-                
-                st.audio(audio_bytes, format='audio/wav')
-                st.download_button(
-                    label="⬇️ Baixar Áudio",
-                    data=audio_bytes,
-                    file_name=f"{nome_estrela}_curva_luz.wav",
-                    mime="audio/wav"
-                )
+        painel_audio_curva(lc_hash, time, flux, nome_estrela)
     
     # Análise de Planetas
     if detect_planets:
@@ -917,7 +1367,7 @@ if buscar:
         st.subheader("Detecção de Planetas")
         
         with st.spinner("Analisando trânsitos planetários..."):
-            planets = analisar_planetas(time, flux)
+            planets = obter_analise('planetas', analisar_planetas, lc_hash, time, flux, flux_stats)
         
         if len(planets) == 0:
             st.warning("Nenhum planeta detectado com os parâmetros atuais")
@@ -926,10 +1376,11 @@ if buscar:
             
             # Tabela de planetas
             df_planets = pd.DataFrame(planets)
-            df_planets['period_days'] = df_planets['period_days'].round(3)
-            df_planets['transit_depth'] = (df_planets['transit_depth'] * 100).round(4)
-            df_planets['transit_duration_hours'] = df_planets['transit_duration_hours'].round(2)
-            df_planets['confidence'] = df_planets['confidence'].round(1)
+            df_planets['transit_depth'] *= 100
+            df_planets = df_planets.round({
+                'period_days': 3, 'transit_depth': 4,
+                'transit_duration_hours': 2, 'confidence': 1
+            })
             
             # Estimar raio do planeta (assumindo estrela tipo solar)
             df_planets['radius_earth'] = (np.sqrt(df_planets['transit_depth'] / 100) * 109).round(2)
@@ -953,18 +1404,15 @@ if buscar:
                 best_planet = planets[0]
                 period = best_planet['period_days']
                 
-                # Dobrar curva
-                phase = (time % period) / period
-                sort_idx = np.argsort(phase)
-                phase_sorted = phase[sort_idx]
-                flux_sorted = flux[sort_idx]
+                # Dobrar curva (média em bins de fase)
+                phase_bins, flux_bins = dobrar_curva_fase(time, flux, period)
                 
                 fig_phase = go.Figure()
-                fig_phase.add_trace(go.Scatter(
-                    x=phase_sorted,
-                    y=flux_sorted,
+                fig_phase.add_trace(go.Scattergl(
+                    x=phase_bins,
+                    y=flux_bins,
                     mode='markers',
-                    marker=dict(size=2, color='cyan', opacity=0.6),
+                    marker=dict(size=4, color='cyan', opacity=0.8),
                     name='Dados'
                 ))
                 
@@ -1006,7 +1454,7 @@ if buscar:
         st.subheader("Detecção de Cometas")
         
         with st.spinner("Procurando por cometas..."):
-            comets = analisar_cometas(time, flux)
+            comets = obter_analise('cometas', analisar_cometas, lc_hash, time, flux, flux_stats)
         
         if len(comets) == 0:
             st.info("Nenhum cometa detectado. Cometas são raros e requerem padrões específicos de variação de brilho.")
@@ -1038,7 +1486,7 @@ if buscar:
                     fig_comet = go.Figure()
                     
                     # Curva de luz completa na janela
-                    fig_comet.add_trace(go.Scatter(
+                    fig_comet.add_trace(go.Scattergl(
                         x=time[mask],
                         y=flux[mask],
                         mode='lines',
@@ -1090,7 +1538,7 @@ if buscar:
                         fig_comet = go.Figure()
                         
                         # Curva de luz completa na janela
-                        fig_comet.add_trace(go.Scatter(
+                        fig_comet.add_trace(go.Scattergl(
                             x=time[mask],
                             y=flux[mask],
                             mode='lines',
@@ -1122,7 +1570,7 @@ if buscar:
         st.subheader("Detecção de Meteoros e Eventos Rápidos")
         
         with st.spinner("Procurando eventos rápidos..."):
-            meteors = analisar_meteoros(time, flux)
+            meteors = obter_analise('meteoros', analisar_meteoros, lc_hash, time, flux, flux_stats)
         
         if len(meteors) == 0:
             st.info("Nenhum meteoro ou evento ultra-rápido detectado.")
@@ -1135,7 +1583,7 @@ if buscar:
             fig_meteors = go.Figure()
             
             # Curva de luz completa
-            fig_meteors.add_trace(go.Scatter(
+            fig_meteors.add_trace(go.Scattergl(
                 x=time,
                 y=flux,
                 mode='lines',
@@ -1176,7 +1624,7 @@ if buscar:
             if np.any(mask):
                 fig_zoom = go.Figure()
                 
-                fig_zoom.add_trace(go.Scatter(
+                fig_zoom.add_trace(go.Scattergl(
                     x=time[mask],
                     y=flux[mask],
                     mode='lines+markers',
@@ -1206,28 +1654,21 @@ if buscar:
             st.subheader("Dados dos Eventos")
             df_meteors = pd.DataFrame(meteors)
             
-            # Criar tabela formatada manualmente
-            table_data = []
-            for meteor in meteors:
-                try:
-                    amplitude = float(meteor.get('amplitude', 0))
-                    detection_time = float(meteor.get('detection_time', 0))
-                    duration_hours = float(meteor.get('duration_hours', 0))
-                    confidence = float(meteor.get('confidence', 0))
-                    
-                    table_data.append({
-                        'Tempo (dias)': round(detection_time, 3),
-                        'Duração (h)': round(duration_hours, 4),
-                        'Amplitude': round(amplitude, 3),
-                        'Tipo': meteor.get('event_type', 'desconhecido'),
-                        'Confiança': f"{round(confidence * 100, 0):.0f}%"
-                    })
-                except (ValueError, TypeError, KeyError) as e:
-                    # Pular eventos com dados inválidos
-                    continue
+            # Formatar por coluna; eventos com dados inválidos são descartados
+            valores = df_meteors.reindex(
+                columns=['detection_time', 'duration_hours', 'amplitude', 'confidence']
+            ).apply(pd.to_numeric, errors='coerce')
+            validos = valores.notna().all(axis=1)
             
-            if table_data:
-                df_display = pd.DataFrame(table_data)
+            if validos.any():
+                valores = valores[validos]
+                df_display = pd.DataFrame({
+                    'Tempo (dias)': valores['detection_time'].round(3),
+                    'Duração (h)': valores['duration_hours'].round(4),
+                    'Amplitude': valores['amplitude'].round(3),
+                    'Tipo': df_meteors.reindex(columns=['event_type'])['event_type'][validos].fillna('desconhecido'),
+                    'Confiança': (valores['confidence'] * 100).round(0).map('{:.0f}%'.format)
+                })
                 st.dataframe(df_display, use_container_width=True)
             else:
                 st.warning("Não foi possível formatar os dados dos eventos.")
@@ -1238,7 +1679,7 @@ if buscar:
         st.subheader("Eventos Transientes (Supernovas, Flares)")
         
         with st.spinner("Procurando eventos transientes..."):
-            transients = analisar_transientes(time, flux)
+            transients = obter_analise('transientes', analisar_transientes, lc_hash, time, flux, flux_stats)
         
         if len(transients) == 0:
             st.info("Nenhum evento transiente significativo detectado.")
@@ -1268,9 +1709,10 @@ if buscar:
                         fig_trans = go.Figure()
                         
                         # Curva de luz na janela
-                        fig_trans.add_trace(go.Scatter(
-                            x=time[mask],
-                            y=flux[mask],
+                        time_janela, flux_janela = reduzir_lttb(time[mask], flux[mask])
+                        fig_trans.add_trace(go.Scattergl(
+                            x=time_janela,
+                            y=flux_janela,
                             mode='lines',
                             name='Fluxo',
                             line=dict(color='cyan', width=1.5)
@@ -1299,7 +1741,10 @@ if buscar:
         cadence_min = 30.0 if cadencia == "long" else 1.0
         
         with st.spinner("Analisando oscilações estelares..."):
-            seismo_analysis = analisar_vibrações(time, flux, cadence_min)
+            seismo_analysis = obter_analise(
+                ('vibracoes', cadence_min), analisar_vibrações,
+                lc_hash, time, flux, cadence_min, flux_stats
+            )
         
         # Parâmetros estelares
         params = seismo_analysis['stellar_parameters']
@@ -1322,10 +1767,16 @@ if buscar:
         frequencies = seismo_analysis['power_spectrum']['frequencies']
         power = seismo_analysis['power_spectrum']['power']
         
-        fig_power = go.Figure()
-        fig_power.add_trace(go.Scatter(
-            x=frequencies,
-            y=power,
+        # Espectros FFT têm >10⁵ pontos: enviar ao navegador só ~2000 bins (a largura
+        # do gráfico em pixels), com o máximo de cada bin para não achatar ν_max;
+        # áudio e modos continuam usando o espectro completo
+        freq_plot, power_plot = reduzir_maximo(frequencies, power)
+        
+        # Cópia da figura base: só os dados mudam entre análises
+        fig_power = go.Figure(figura_base_espectro())
+        fig_power.add_trace(go.Scattergl(
+            x=freq_plot,
+            y=power_plot,
             mode='lines',
             line=dict(color='cyan', width=1),
             name='Potência'
@@ -1340,14 +1791,6 @@ if buscar:
             annotation_text=f"ν_max = {nu_max:.1f} μHz"
         )
         
-        fig_power.update_layout(
-            template='plotly_dark',
-            xaxis_title="Frequência (μHz)",
-            yaxis_title="Potência",
-            height=400,
-            showlegend=False
-        )
-        
         st.plotly_chart(fig_power, use_container_width=True)
         
         # SONIFICAÇÃO DAS VIBRAÇÕES
@@ -1359,34 +1802,21 @@ if buscar:
             st.info(get_sonificador().descrever_sonificacao('vibracoes'))
         
         with col2:
-            duracao_vibr = st.slider("Duração (s)", 5, 20, 10, key='duracao_vibr')
-            if st.button("🎵 Gerar Áudio das Vibrações", use_container_width=True):
-                with st.spinner("Sintetizando frequências estelares..."):
-                    audio_vibr, sr_vibr = get_sonificador().sonificar_vibracoes(
-                        frequencies, power, duracao_segundos=duracao_vibr
-                    )
-                    audio_vibr_bytes = get_sonificador().criar_wav_bytes(audio_vibr, sr_vibr)
-                    
-                    st.audio(audio_vibr_bytes, format='audio/wav')
-                    st.download_button(
-                        label="⬇️ Baixar Áudio",
-                        data=audio_vibr_bytes,
-                        file_name=f"{nome_estrela}_vibracoes.wav",
-                        mime="audio/wav",
-                        key='download_vibr'
-                    )
+            painel_audio_vibracoes(lc_hash, cadence_min, frequencies, power, nome_estrela)
         
         # Modos de oscilação
         modes = seismo_analysis['oscillation_modes']
         if len(modes) > 0:
             st.subheader(f"Modos de Oscilação Detectados: {len(modes)}")
             
-            df_modes = pd.DataFrame(modes[:10])  # Top 10
-            df_modes['frequency_uHz'] = df_modes['frequency_uHz'].round(2)
-            df_modes['amplitude'] = df_modes['amplitude'].round(6)
-            
-            df_display_modes = df_modes[['frequency_uHz', 'type', 'mode_order']].copy()
-            df_display_modes.columns = ['Frequência (μHz)', 'Tipo', 'Ordem']
+            # Top 10: só as colunas exibidas são arredondadas e renomeadas
+            df_display_modes = (
+                modes.head(10)[['frequency_uHz', 'type', 'mode_order']]
+                .round({'frequency_uHz': 2})
+                .rename(columns={
+                    'frequency_uHz': 'Frequência (μHz)', 'type': 'Tipo', 'mode_order': 'Ordem'
+                })
+            )
             
             st.dataframe(df_display_modes, use_container_width=True)
     
@@ -1395,9 +1825,9 @@ if buscar:
     st.header("Análise de Descobertas")
     
     # Coletar todas as detecções
-    planetas_detectados = analisar_planetas(time, flux) if detect_planets else []
-    cometas_detectados = analisar_cometas(time, flux) if detect_comets else []
-    meteoros_detectados = analisar_meteoros(time, flux) if detect_meteors else []
+    planetas_detectados = obter_analise('planetas', analisar_planetas, lc_hash, time, flux, flux_stats) if detect_planets else []
+    cometas_detectados = obter_analise('cometas', analisar_cometas, lc_hash, time, flux, flux_stats) if detect_comets else []
+    meteoros_detectados = obter_analise('meteoros', analisar_meteoros, lc_hash, time, flux, flux_stats) if detect_meteors else []
     
     # Verificar com SIMBAD (passar coordenadas e modo)
     usar_modo_profissional = (modo_verificacao == "Profissional (Astroquery CDS)")
@@ -1428,224 +1858,18 @@ if buscar:
     if len(descobertas) > 0:
         st.warning(f"**ATENÇÃO: {len(descobertas)} possíveis descobertas ou objetos de interesse detectados!**")
         
-        for desc in descobertas:
-            # Ícone baseado no status SIMBAD
-            if desc['status'] == 'NOVA':
-                status_color = "�"
-                status_msg = "POTENCIAL DESCOBERTA!"
-            elif desc['status'] == 'CONHECIDA':
-                status_color = "⚪"
-                status_msg = "OBJETO CONHECIDO"
-            elif desc['status'] == 'CANDIDATA':
-                status_color = "🟡"
-                status_msg = "CANDIDATO"
-            else:
-                status_color = "🔵"
-                status_msg = "ANALISAR"
-            
-            prioridade = desc.get('prioridade', 2)
-            
-            with st.expander(
-                f"{status_color} {desc['tipo']} #{desc['indice']} - {status_msg} (Prioridade: {prioridade}/5)", 
-                expanded=(prioridade >= 4)
-            ):
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Confiança Detecção", f"{desc['confianca']:.1f}%")
-                with col2:
-                    st.metric("Status SIMBAD", desc['status'])
-                with col3:
-                    st.metric("Prioridade", f"{prioridade}/5")
-                
-                st.info(f"**Parâmetros:** {desc['parametros']}")
-                
-                # Mostrar resultado SIMBAD
-                if 'simbad' in desc and desc['simbad']:
-                    st.divider()
-                    st.subheader("Verificação SIMBAD (Modo Rápido)")
-                    
-                    resultado_simbad = desc['simbad']
-                    
-                    col1, col2 = st.columns([2, 1])
-                    with col1:
-                        total_objetos = resultado_simbad.get('total_objetos', 0)
-                        
-                        if total_objetos == 0:
-                            st.success("✅ **Nenhum objeto conhecido encontrado nestas coordenadas!**")
-                        else:
-                            st.warning(f"⚠️ **{total_objetos} objetos encontrados no campo**")
-                            
-                            obj_principal = resultado_simbad.get('objeto_principal')
-                            if obj_principal:
-                                st.markdown(f"""
-**Objeto mais próximo:**
-- **Nome:** {obj_principal.get('identificador', 'N/A')}
-- **Tipo:** {obj_principal.get('tipo', 'N/A')}
-- **Distância:** {obj_principal.get('distancia_arcsec', 0):.2f} arcsec
-- **Referências:** {obj_principal.get('referencias', 0)} papers
-                                """)
-                                
-                                if obj_principal.get('distancia_arcsec', 999) < 5:
-                                    st.info("🎯 Objeto muito próximo (< 5 arcsec) - Provavelmente é o mesmo objeto")
-                                elif obj_principal.get('distancia_arcsec', 999) < 30:
-                                    st.warning("📍 Objeto moderadamente próximo - Pode ser o mesmo ou campo estelar")
-                                else:
-                                    st.success("📍 Objeto distante - Sua detecção pode ser algo novo no campo!")
-                    
-                    with col2:
-                        url_simbad = resultado_simbad.get('url_busca', '')
-                        if url_simbad:
-                            st.markdown(f"[🔗 Ver no SIMBAD]({url_simbad})")
-                
-                # Mostrar resultado CDS Profissional
-                if 'cds_profissional' in desc and desc['cds_profissional']:
-                    st.divider()
-                    st.subheader("🎓 Verificação Profissional CDS")
-                    
-                    resultado_cds = desc['cds_profissional']
-                    
-                    # Relatório completo
-                    relatorio = get_cds_checker().gerar_relatorio_profissional(resultado_cds)
-                    st.markdown(relatorio)
-                    
-                    # Detalhes adicionais em expanders
-                    if resultado_cds['simbad']['total_objetos'] > 0:
-                        with st.expander("Ver todos os objetos SIMBAD encontrados"):
-                            for obj in resultado_cds['simbad']['objetos']:
-                                st.markdown(f"""
-**{obj['nome']}**
-- Tipo: {obj['tipo']}
-- Separação: {obj['separacao_arcsec']:.2f} arcsec
-- Mag V: {obj['mag_v'] if obj['mag_v'] else 'N/A'}
-- Referências: {obj['referencias']}
-                                """)
-                                st.divider()
-                    
-                    # Exoplanetas
-                    if resultado_cds['exoplanetas'] and resultado_cds['exoplanetas']['total_planetas'] > 0:
-                        with st.expander(f"Ver {resultado_cds['exoplanetas']['total_planetas']} planetas conhecidos"):
-                            for planeta in resultado_cds['exoplanetas']['planetas']:
-                                st.json(planeta['dados'])
-                    
-                    # Variáveis
-                    if resultado_cds['variaveis'] and resultado_cds['variaveis']['total_variaveis'] > 0:
-                        with st.expander(f"Ver {resultado_cds['variaveis']['total_variaveis']} estrelas variáveis"):
-                            for var in resultado_cds['variaveis']['variaveis']:
-                                periodo_str = f"{var['periodo']:.2f}d" if var['periodo'] else 'N/A'
-                                st.markdown(f"""
-**{var['nome']}**
-- Tipo: {var['tipo']}
-- Período: {periodo_str}
-- Amplitude: {var['max_mag']:.2f} - {var['min_mag']:.2f} mag
-                                """)
-                                st.divider()
-                
-                # Recomendação do sistema
-                if 'recomendacao_simbad' in desc:
-                    st.divider()
-                    if desc['status'] == 'NOVA':
-                        st.success(f"**Recomendação:** {desc['recomendacao_simbad']}")
-                    elif desc['status'] == 'CONHECIDA':
-                        st.info(f"**Análise:** {desc['recomendacao_simbad']}")
-                    else:
-                        st.warning(f"**Recomendação:** {desc['recomendacao_simbad']}")
-                
-                # Erro na verificação SIMBAD
-                if 'simbad_erro' in desc:
-                    st.error(f"⚠️ Erro ao verificar SIMBAD: {desc['simbad_erro']}")
-                    st.info("Verifique manualmente no link acima ou tente novamente mais tarde.")
-                
-                # Próximos passos baseado no status
-                if desc['status'] == 'NOVA':
-                    st.divider()
-                    st.success("### 🎉 POSSÍVEL DESCOBERTA!")
-                    
-                    st.markdown("### Próximos Passos:")
-                    
-                    tab1, tab2, tab3 = st.tabs(["Verificação", "Monitoramento", "Publicação"])
-                    
-                    with tab1:
-                        st.markdown("""
-                        **Verificações adicionais:**
-                        
-                        1. ✅ Verificado no SIMBAD - Não encontrado
-                        2. 🔍 Verificar em outros catálogos:
-                           - NASA Exoplanet Archive
-                           - VizieR (catálogos variados)
-                           - Minor Planet Center (se for cometa/asteroide)
-                        3. 🔍 Buscar em papers recentes (últimos 6 meses)
-                        
-                        **Se continuar não encontrando = DESCOBERTA CONFIRMADA!**
-                        """)
-                        
-                        if ra is not None and dec is not None:
-                            st.code(f"""
-Links para verificação adicional:
-
-NASA Exoplanet Archive:
-https://exoplanetarchive.ipac.caltech.edu/
-
-VizieR:
-https://vizier.u-strasbg.fr/viz-bin/VizieR?-c={ra}+{dec}&-c.rs=2
-
-ArXiv recentes (últimos 6 meses):
-https://arxiv.org/search/?query={ra}+{dec}&searchtype=all&order=-announced_date_first&size=50
-                            """)
-                    
-                    with tab2:
-                        st.markdown("""
-                        **Continue observando:**
-                        
-                        - ✓ Faça pelo menos 3 observações em datas diferentes
-                        - ✓ Use cadência curta (short) para maior precisão
-                        - ✓ Tente outras missões (Kepler + TESS)
-                        - ✓ Documente todas as observações
-                        
-                        O sistema já está salvando automaticamente no banco de dados.
-                        """)
-                    
-                    with tab3:
-                        st.markdown("""
-                        **Como reportar sua descoberta:**
-                        
-                        **Para Planetas:**
-                        - 📧 NASA Exoplanet Archive
-                        - 📧 Exoplanet.eu
-                        - 📄 Publicar paper em journals: AJ, ApJ, MNRAS
-                        
-                        **Para Cometas/Asteroides:**
-                        - 📧 Minor Planet Center (MPC)
-                        - 📧 Central Bureau for Astronomical Telegrams
-                        
-                        **Para Transientes (Supernovas):**
-                        - 📧 Transient Name Server (TNS)
-                        - 📧 AAVSO
-                        
-                        **Dica:** Aguarde confirmação de pelo menos 3 observações independentes!
-                        """)
-                
-                elif desc['status'] == 'CONHECIDA':
-                    st.info("""
-                    **Validação bem-sucedida!** 
-                    
-                    Seu sistema detectou corretamente um objeto conhecido, confirmando que:
-                    - ✅ Os algoritmos de detecção estão funcionando
-                    - ✅ A análise de dados está precisa
-                    - ✅ O sistema pode encontrar objetos reais
-                    
-                    Continue procurando em outras estrelas menos estudadas!
-                    """)
-                
-                elif desc['status'] == 'CANDIDATA':
-                    st.warning("""
-                    **Candidato interessante.** Necessita mais observações para confirmação.
-                    
-                    **Ações recomendadas:**
-                    - Continue monitorando este objeto
-                    - Faça mais 2-3 observações
-                    - Use diferentes configurações de cadência
-                    - Verifique se o padrão se repete
-                    """)
+        # Resumo em uma única tabela; detalhes só para a descoberta selecionada
+        df_descobertas = pd.DataFrame({
+            'Tipo': [desc['tipo'] for desc in descobertas],
+            'Índice': [desc['indice'] for desc in descobertas],
+            'Status': [f"{rotulo_status(desc['status'])[0]} {desc['status']}" for desc in descobertas],
+            'Confiança (%)': [round(float(desc['confianca']), 1) for desc in descobertas],
+            'Prioridade': [f"{desc.get('prioridade', 2)}/5" for desc in descobertas],
+            'Parâmetros': [desc['parametros'] for desc in descobertas]
+        })
+        st.dataframe(df_descobertas, use_container_width=True, hide_index=True)
+        
+        mostrar_detalhes_descoberta(descobertas, ra, dec)
     else:
         st.info("Nenhuma descoberta potencial detectada com os critérios atuais. Objetos detectados parecem corresponder a padrões conhecidos.")
     
@@ -1662,7 +1886,7 @@ https://arxiv.org/search/?query={ra}+{dec}&searchtype=all&order=-announced_date_
             'planetas': planetas_detectados,
             'cometas': cometas_detectados,
             'meteoros': meteoros_detectados,
-            'transientes': analisar_transientes(time, flux) if detect_transients else [],
+            'transientes': obter_analise('transientes', analisar_transientes, lc_hash, time, flux, flux_stats) if detect_transients else [],
             'descobertas': descobertas
         }
         
@@ -1690,7 +1914,7 @@ if 'mostrar_historico' in st.session_state and st.session_state['mostrar_histori
     st.header("Histórico e Estatísticas do Banco de Dados")
     
     # Estatísticas gerais
-    stats = get_database().estatisticas_gerais()
+    stats = obter_estatisticas()
     
     st.subheader("Estatísticas Gerais")
     col1, col2, col3, col4 = st.columns(4)
@@ -1715,10 +1939,15 @@ if 'mostrar_historico' in st.session_state and st.session_state['mostrar_histori
     
     # Lista de descobertas
     st.subheader("Últimas Descobertas Potenciais")
-    descobertas_db = get_database().listar_descobertas_novas(limit=20)
+    descobertas_db = obter_descobertas_novas(limit=20)
     
     if descobertas_db:
-        for desc in descobertas_db:
+        # Coordenadas sexagesimais de todas as descobertas calculadas de uma vez
+        ras_hms, decs_dms = converter_sexagesimal(
+            [desc['ra'] for desc in descobertas_db],
+            [desc['dec'] for desc in descobertas_db]
+        )
+        for desc, ra_hms, dec_dms in zip(descobertas_db, ras_hms, decs_dms):
             status_color = "🔴" if desc['status'] == 'NOVO' else "🟡"
             with st.expander(f"{status_color} {desc['nome']} - {desc['tipo']} (Confiança: {desc['confianca']:.1f}%)"):
                 col1, col2, col3 = st.columns(3)
@@ -1764,22 +1993,13 @@ if 'mostrar_historico' in st.session_state and st.session_state['mostrar_histori
                     """)
                     
                     # Coordenadas para copiar
-                    ra_h = int(desc['ra'] / 15)
-                    ra_m = int((desc['ra'] / 15 - ra_h) * 60)
-                    ra_s = ((desc['ra'] / 15 - ra_h) * 60 - ra_m) * 60
-                    
-                    dec_sign = '+' if desc['dec'] >= 0 else '-'
-                    dec_d = int(abs(desc['dec']))
-                    dec_m = int((abs(desc['dec']) - dec_d) * 60)
-                    dec_s = ((abs(desc['dec']) - dec_d) * 60 - dec_m) * 60
-                    
                     st.code(f"""
 Coordenadas para busca em catálogos:
 RA (decimal): {desc['ra']:.4f}°
 Dec (decimal): {desc['dec']:.4f}°
 
-RA (sexagesimal): {ra_h:02d}h {ra_m:02d}m {ra_s:05.2f}s
-Dec (sexagesimal): {dec_sign}{dec_d:02d}° {dec_m:02d}' {dec_s:05.2f}"
+RA (sexagesimal): {ra_hms}
+Dec (sexagesimal): {dec_dms}
 
 Busca SIMBAD: 
 http://get_simbad_checker().u-strasbg.fr/simbad/sim-coo?Coord={desc['ra']}+{desc['dec']}&Radius=2
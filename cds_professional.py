@@ -3,127 +3,661 @@ Integração Profissional com CDS (Centre de Données astronomiques de Strasbour
 Usa bibliotecas oficiais: astroquery.simbad, astroquery.vizier
 """
 
-from astroquery.simbad import Simbad
-from astroquery.vizier import Vizier
-from astropy.coordinates import SkyCoord
-from astropy import units as u
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from pathlib import Path
+import hashlib
+import os
+import pickle
+import threading
+import time
 import numpy as np
 
+# astroquery/astropy são importados no primeiro uso: só importar o módulo não
+# carrega os frames de coordenadas, o parser de VOTable etc.
+
+# Resultados de consultas já feitas ficam em disco, indexados pela coordenada
+# arredondada (~0.004") e pelo raio de busca
+CACHE_DIR = Path('.cds_cache')
+VERSAO_CACHE = 2  # incrementar quando o formato dos resultados mudar
+
+# Validade (segundos) dos resultados em cache, por verificação: SIMBAD e
+# exoplanetas mudam devagar; VSX e transientes recebem entradas novas sempre
+VALIDADE_CACHE = {
+    'verificar_simbad_completo': 30 * 86400,
+    'verificar_exoplanetas': 30 * 86400,
+    'verificar_variaveis': 7 * 86400,
+    'verificar_transientes': 86400,
+}
+
+# Os mesmos resultados também ficam numa LRU em memória, à frente do disco
+TAMANHO_CACHE_MEMORIA = 4096
+_cache_memoria = OrderedDict()
+_trava_cache = threading.Lock()
+
+# O SIMBAD bloqueia temporariamente clientes acima de ~6 consultas/s
+INTERVALO_MIN_CONSULTAS = 0.2  # segundos entre o início de duas consultas
+TENTATIVAS_CONSULTA = 3
+
+# Cone SIMBAD via TAP: objeto, tipo, posição, tipo espectral, nº de referências,
+# magnitude V e identificadores numa única consulta ADQL. Os aliases mantêm os
+# nomes de coluna da interface antiga (MAIN_ID, FLUX_V, ...)
+ADQL_CONE_SIMBAD = """
+SELECT b.main_id AS "MAIN_ID", b.otype AS "OTYPE", b.ra AS "RA", b.dec AS "DEC",
+       b.sp_type AS "SP_TYPE", b.nbref AS "NBREF", f.flux AS "FLUX_V", i.ids AS "IDS"
+FROM basic AS b
+LEFT JOIN flux AS f ON f.oidref = b.oid AND f.filter = 'V'
+LEFT JOIN ids AS i ON i.oidref = b.oid
+WHERE CONTAINS(POINT('ICRS', b.ra, b.dec), CIRCLE('ICRS', {ra:.8f}, {dec:.8f}, {raio:.8f})) = 1
+ORDER BY DISTANCE(POINT('ICRS', b.ra, b.dec), POINT('ICRS', {ra:.8f}, {dec:.8f}))
+"""
+
+# Cruzamento de várias coordenadas (TAP_UPLOAD.alvos) com o SIMBAD numa consulta
+ADQL_LOTE_SIMBAD = """
+SELECT alvos.indice AS "INDICE", b.main_id AS "MAIN_ID", b.otype AS "OTYPE",
+       b.ra AS "RA", b.dec AS "DEC", b.sp_type AS "SP_TYPE", b.nbref AS "NBREF",
+       f.flux AS "FLUX_V", i.ids AS "IDS"
+FROM TAP_UPLOAD.alvos AS alvos
+JOIN basic AS b ON 1 = CONTAINS(POINT('ICRS', b.ra, b.dec),
+                                CIRCLE('ICRS', alvos.ra, alvos.dec, {raio:.8f}))
+LEFT JOIN flux AS f ON f.oidref = b.oid AND f.filter = 'V'
+LEFT JOIN ids AS i ON i.oidref = b.oid
+"""
+
+# Catálogos VizieR e colunas pedidas ao VSX ('+_r': distância ao alvo, ordenando
+# as linhas). Exoplanetas e transientes vão inteiros para a interface, sem projeção
+CATALOGOS_EXOPLANETAS = ['B/exopl', 'V/150', 'J/ApJS/197/8']
+CATALOGOS_TRANSIENTES = ['VII/282', 'B/sn']
+COLUNAS_VSX = ('Name', 'Type', 'Period', 'max', 'min', '+_r')
+
+# Tipo SIMBAD (OTYPE) do objeto coincidente com o alvo → única verificação de
+# catálogo que ainda pode mudar a classificação (usado com force=False)
+SEPARACAO_IDENTIDADE = 1.0  # arcsec
+VERIFICACOES_POR_OTYPE = {
+    'Pl': 'exoplanetas', 'Pl?': 'exoplanetas',
+    **dict.fromkeys(['V*', 'V*?', 'Pu*', 'RR*', 'Ce*', 'cC*', 'dS*', 'bC*', 'SX*', 'gD*',
+                     'Mi*', 'LP*', 'RV*', 'Ir*', 'Or*', 'Er*', 'RS*', 'BY*', 'Ro*', 'a2*',
+                     'ZZ*', 'EB*', 'El*', 'Fl*', 'TT*', 'Ae*'], 'variaveis'),
+    **dict.fromkeys(['SN*', 'SN?', 'No*', 'No?', 'CV*', 'CV?', 'ev', 'gam', 'GRB'], 'transientes'),
+}
+
+# Limites de linhas por consulta: a classificação usa o objeto mais próximo e o
+# relatório mostra no máximo 3 variáveis. VizieR ordena por distância ('+_r')
+# e o ADQL acima também, então os cortes mantêm sempre os mais próximos
+LIMITE_OBJETOS_SIMBAD = 10
+LIMITE_LINHAS_CATALOGO = 5
+LIMITE_LINHAS_VSX = 10
+
+_trava_consultas = threading.Lock()
+_ultima_consulta = 0.0
+
+# Sessão HTTP (keep-alive) comum a todos os clientes SIMBAD/VizieR
+_sessao_cds = None
+
+# Faixas de separação (arcsec) do objeto SIMBAD mais próximo: < 5 mesmo objeto,
+# < 30 possível mesmo objeto, < 120 campo estelar, acima disso muito distante
+LIMITES_SEPARACAO = np.array([5.0, 30.0, 120.0])
+STATUS_SEPARACAO = ('CONHECIDA', 'CANDIDATA', 'CAMPO_ESTELAR', 'CAMPO_ESTELAR')
+
+
+def _faixa_separacao(separacao_arcsec):
+    """Índice da faixa de LIMITES_SEPARACAO em que cai a separação (limites exclusivos)"""
+    return int(np.searchsorted(LIMITES_SEPARACAO, separacao_arcsec, side='right'))
+
+
+def _status_separacao(separacoes_min):
+    """
+    Status SIMBAD de vários alvos a partir da separação do objeto mais próximo de cada um
+    
+    Uma única chamada searchsorted para todos os alvos; separação infinita ou NaN
+    (cone vazio) vira 'POTENCIAL_NOVA'.
+    """
+    separacoes_min = np.asarray(separacoes_min, dtype=float)
+    faixas = np.searchsorted(LIMITES_SEPARACAO, separacoes_min, side='right')
+    return np.where(np.isfinite(separacoes_min), np.take(STATUS_SEPARACAO, faixas), 'POTENCIAL_NOVA')
+
+
+def _texto_total_objetos(resultado_simbad):
+    """Total de objetos SIMBAD para exibição ('≥N' quando a consulta foi cortada no limite)"""
+    total = resultado_simbad['total_objetos']
+    return f"≥{total}" if resultado_simbad.get('total_limitado') else str(total)
+
+
+def _criar_coord(ra, dec):
+    """
+    SkyCoord ICRS para (ra, dec) em graus (escalares ou arrays)
+    
+    Coordenadas escalares são memorizadas: chamadas diretas aos verificar_*
+    e repetições do mesmo alvo reaproveitam o mesmo SkyCoord.
+    """
+    if np.ndim(ra) == 0 and np.ndim(dec) == 0:
+        return _criar_coord_escalar(float(ra), float(dec))
+    
+    from astropy.coordinates import SkyCoord
+    from astropy import units as u
+    return SkyCoord(ra=ra*u.degree, dec=dec*u.degree, frame='icrs')
+
+
+@lru_cache(maxsize=256)
+def _criar_coord_escalar(ra, dec):
+    from astropy.coordinates import SkyCoord
+    from astropy import units as u
+    return SkyCoord(ra=ra*u.degree, dec=dec*u.degree, frame='icrs')
+
+
+def _consultar_remoto(consulta, *args, **kwargs):
+    """
+    Executa uma consulta ao CDS respeitando o limite de taxa do servidor
+    
+    Quedas de conexão (comuns e passageiras no SIMBAD) são repetidas até
+    TENTATIVAS_CONSULTA vezes, com espera exponencial (1 s, 2 s, ...) entre elas.
+    """
+    global _ultima_consulta
+    import requests
+    from http.client import RemoteDisconnected
+    
+    for tentativa in range(TENTATIVAS_CONSULTA):
+        with _trava_consultas:
+            espera = _ultima_consulta + INTERVALO_MIN_CONSULTAS - time.monotonic()
+            if espera > 0:
+                time.sleep(espera)
+            _ultima_consulta = time.monotonic()
+        
+        try:
+            return consulta(*args, **kwargs)
+        except (requests.ConnectionError, RemoteDisconnected):
+            if tentativa == TENTATIVAS_CONSULTA - 1:
+                raise
+            time.sleep(2 ** tentativa)
+
+
+def _compartilhar_sessao(cliente):
+    """
+    Faz o cliente astroquery usar a sessão requests comum a SIMBAD e VizieR
+    
+    A primeira sessão recebida (com User-Agent do astroquery) vira a compartilhada,
+    com pool ampliado: o padrão do requests guarda só 10 conexões por host e cada
+    cliente teria as suas, pagando outro handshake TLS a cada conexão nova.
+    
+    Depende de atributos privados do astroquery (verificado no 0.4.11): a sessão
+    requests em BaseQuery._session e o TAPService do Simbad em _tap, criado sob
+    demanda com essa sessão. Sem _session o cliente fica com a própria sessão.
+    O adaptador não repete requisições: as novas tentativas ficam só em
+    _consultar_remoto.
+    """
+    global _sessao_cds
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    sessao = getattr(cliente, '_session', None)
+    if not isinstance(sessao, requests.Session):
+        return cliente
+    if _sessao_cds is None:
+        adaptador = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        sessao.mount('https://', adaptador)
+        sessao.mount('http://', adaptador)
+        _sessao_cds = sessao
+    else:
+        cliente._session = _sessao_cds
+        if getattr(cliente, '_tap', None) is not None:
+            cliente._tap = None  # TAPService é recriado com a sessão nova
+    return cliente
+
+
+@lru_cache(maxsize=None)
+def _get_simbad():
+    """Cliente SIMBAD configurado, compartilhado por todas as instâncias do verificador"""
+    from astroquery.simbad import Simbad
+    
+    simbad = Simbad()
+    simbad.add_votable_fields('otype', 'flux(V)', 'sp', 'ids')
+    # Número de referências vem na própria consulta (sem query_bibobj por objeto):
+    # nbref no SIMBAD via TAP, bibcodelist(y1-y2) nas versões antigas do astroquery
+    for campo in ('nbref', 'bibcodelist(1800-2100)'):
+        try:
+            simbad.add_votable_fields(campo)
+            break
+        except:
+            pass  # Campo indisponível nesta versão do astroquery
+    return _compartilhar_sessao(simbad)
+
+
+@lru_cache(maxsize=None)
+def _get_vizier(colunas=('*', '+_r'), row_limit=50):
+    """Cliente VizieR configurado, compartilhado por todas as instâncias do verificador"""
+    from astroquery.vizier import Vizier
+    return _compartilhar_sessao(Vizier(columns=list(colunas), row_limit=row_limit))
+
+
+def _colunas_maiusculas(table):
+    """
+    Renomeia as colunas de uma tabela SIMBAD para maiúsculas (MAIN_ID, RA, DEC, ...)
+    
+    query_region no astroquery >= 0.4.8 devolve main_id, ra, dec; o TAP já vem
+    com os aliases da interface antiga.
+    """
+    if table is not None:
+        for nome in table.colnames:
+            if nome != nome.upper():
+                table.rename_column(nome, nome.upper())
+    return table
+
+
+def _coluna_float(table, nome, preenchimento=np.nan):
+    """Coluna numérica como array float, com valores mascarados (ou coluna ausente) preenchidos"""
+    if nome not in table.colnames:
+        return np.full(len(table), preenchimento)
+    valores = np.array(table[nome], dtype=float)
+    valores[np.ma.getmaskarray(table[nome])] = preenchimento
+    return valores
+
+
+def _sem_colunas_vazias(table):
+    """Projeção da tabela nas colunas com ao menos um valor não mascarado"""
+    if len(table) == 0:
+        return table
+    colunas = [c for c in table.colnames if not np.ma.getmaskarray(table[c]).all()]
+    return table if len(colunas) == len(table.colnames) else table[colunas]
+
+
+def _coluna_texto(table, nome, padrao='Unknown', mascarado='--'):
+    """Coluna como lista de str (mascarado nos valores mascarados; padrao se a coluna não existir)"""
+    if nome not in table.colnames:
+        return [padrao] * len(table)
+    return np.ma.filled(np.ma.asarray(table[nome]).astype(str), mascarado).tolist()
+
+
+def _coluna_opcional(table, nome):
+    """Coluna numérica como lista de float, com None nos valores mascarados ou ausentes"""
+    valores = _coluna_float(table, nome)
+    return np.where(np.isnan(valores), None, valores).tolist()
+
+
+def _cache_em_disco(metodo):
+    """
+    Memoriza o resultado de um método verificar_*(ra, dec, coord=None)
+    
+    Primeiro numa LRU em memória (consultas repetidas no mesmo processo não
+    abrem arquivo), depois em disco (self.cache_dir), compartilhado entre
+    processos e sessões. Resultados mais antigos que VALIDADE_CACHE são refeitos.
+    """
+    validade = VALIDADE_CACHE.get(metodo.__name__, 30 * 86400)
+    
+    @wraps(metodo)
+    def wrapper(self, ra, dec, coord=None):
+        chave = (VERSAO_CACHE, metodo.__name__, round(float(ra), 6), round(float(dec), 6),
+                 float(self.radius.to_value('arcsec')))
+        agora = time.time()
+        
+        with _trava_cache:
+            if chave in _cache_memoria:
+                criado, resultado = _cache_memoria[chave]
+                if agora - criado < validade:
+                    _cache_memoria.move_to_end(chave)
+                    return resultado
+                del _cache_memoria[chave]
+        
+        resultado = None
+        criado = agora
+        arquivo = None
+        if self.cache_dir is not None:
+            # Subdiretórios pelos 2 primeiros caracteres do hash: diretórios menores
+            nome = hashlib.sha1(repr(chave).encode()).hexdigest()
+            arquivo = self.cache_dir / nome[:2] / (nome + '.pkl')
+            try:
+                criado = arquivo.stat().st_mtime
+                if agora - criado < validade:
+                    with open(arquivo, 'rb') as f:
+                        resultado = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+        
+        if resultado is None:
+            criado = agora
+            resultado = metodo(self, ra, dec, coord=coord)
+            
+            # Falhas de rede não são memorizadas
+            if 'erro' in resultado:
+                return resultado
+            
+            if arquivo is not None:
+                try:
+                    arquivo.parent.mkdir(parents=True, exist_ok=True)
+                    temporario = arquivo.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+                    with open(temporario, 'wb') as f:
+                        pickle.dump(resultado, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(temporario, arquivo)
+                except (OSError, pickle.PicklingError):
+                    pass
+        
+        with _trava_cache:
+            _cache_memoria[chave] = (criado, resultado)
+            if len(_cache_memoria) > TAMANHO_CACHE_MEMORIA:
+                _cache_memoria.popitem(last=False)
+        
+        return resultado
+    return wrapper
+
 class CDSProfessionalChecker:
     """Verificador profissional usando APIs oficiais da CDS"""
     
-    def __init__(self, radius_arcsec=120):  # 2 arcmin = 120 arcsec
+    def __init__(self, radius_arcsec=120, raio_max_cone_arcsec=1800, cache_dir=CACHE_DIR):  # 2 arcmin = 120 arcsec
         """
         Inicializa verificador CDS profissional
         
         Args:
             radius_arcsec: Raio de busca em arcsegundos (padrão: 120 = 2 arcmin)
+            raio_max_cone_arcsec: Raio acima do qual a busca SIMBAD é dividida em
+                sub-cones menores (padrão: 1800 = 30 arcmin)
+            cache_dir: Diretório do cache em disco das verificações (None desativa)
         """
+        from astropy import units as u
+        
         self.radius = radius_arcsec * u.arcsec
+        self.raio_max_cone = raio_max_cone_arcsec * u.arcsec
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         
-        # Configurar SIMBAD com campos adicionais
-        self.simbad = Simbad()
-        self.simbad.add_votable_fields('otype', 'flux(V)', 'sp', 'ids')
+        # Clientes SIMBAD/VizieR configurados uma vez por processo
+        self.simbad = _get_simbad()
         
-        # Configurar VizieR
-        self.vizier = Vizier(columns=['*', '+_r'], row_limit=50)
+        # Exoplanetas e transientes: todas as colunas (a tabela de planetas é exibida inteira)
+        self.vizier = _get_vizier(row_limit=LIMITE_LINHAS_CATALOGO)
+        
+        # VSX: só as colunas usadas na verificação de variáveis (+ distância ao centro)
+        self.vizier_vsx = _get_vizier(COLUNAS_VSX, row_limit=LIMITE_LINHAS_VSX)
+        
+        # Pool das consultas de verificacao_completa, criado uma vez por verificador
+        # (no máximo 4 simultâneas, para respeitar o limite de consultas do CDS)
+        self._executor = ThreadPoolExecutor(max_workers=4)
+    
+    def limpar_cache(self, disco=False):
+        """
+        Esquece os resultados memorizados das verificações
+        
+        Args:
+            disco: Apagar também o cache em disco (self.cache_dir)
+        """
+        with _trava_cache:
+            _cache_memoria.clear()
+        if disco and self.cache_dir is not None:
+            for arquivo in self.cache_dir.rglob('*.pkl'):
+                arquivo.unlink(missing_ok=True)
     
-    def verificar_simbad_completo(self, ra, dec):
+    @_cache_em_disco
+    def verificar_simbad_completo(self, ra, dec, coord=None):
         """
         Verificação completa no SIMBAD usando astroquery oficial
         
         Args:
             ra: Ascensão Reta em graus
             dec: Declinação em graus
+            coord: SkyCoord já construído para (ra, dec), se disponível
             
         Returns:
             dict com resultados detalhados
         """
         try:
-            coord = SkyCoord(ra=ra*u.degree, dec=dec*u.degree, frame='icrs')
-            result_table = self.simbad.query_region(coord, radius=self.radius)
+            if coord is None:
+                coord = _criar_coord(ra, dec)
+            if self.radius > self.raio_max_cone:
+                result_table = self._tiled_query_region(coord)
+            else:
+                result_table = self._consultar_cone_simbad(coord, self.radius, limite=LIMITE_OBJETOS_SIMBAD)
+                return self._resultado_simbad(ra, dec, coord, result_table, limite=LIMITE_OBJETOS_SIMBAD)
+            return self._resultado_simbad(ra, dec, coord, result_table)
             
-            if result_table is None or len(result_table) == 0:
-                return {
-                    'encontrado': False,
-                    'total_objetos': 0,
-                    'objetos': [],
-                    'status': 'POTENCIAL_NOVA',
-                    'coord_busca': f"{ra:.6f}, {dec:.6f}"
-                }
+        except Exception as e:
+            return self._erro_simbad(ra, dec, e)
+    
+    def _consultar_cone_simbad(self, coord, raio, limite=None):
+        """
+        Objetos SIMBAD num cone, pelo serviço TAP, do mais próximo ao mais distante
+        
+        Se o TAP não responder (ou não existir nesta versão do astroquery), repete
+        a busca com query_region.
+        
+        Args:
+            limite: Número máximo de objetos (os mais próximos); None = todos
+        """
+        try:
+            adql = ADQL_CONE_SIMBAD.format(ra=coord.ra.deg, dec=coord.dec.deg, raio=raio.to_value('deg'))
+            if limite is not None:
+                return _consultar_remoto(self.simbad.query_tap, adql, maxrec=limite)
+            return _consultar_remoto(self.simbad.query_tap, adql)
+        except Exception:
+            return _colunas_maiusculas(_consultar_remoto(self.simbad.query_region, coord, radius=raio))
+    
+    def _tiled_query_region(self, coord):
+        """
+        Consulta SIMBAD de um cone grande dividida em sub-cones
+        
+        Cones muito largos em campos densos estouram limites de tamanho/tempo do
+        servidor. Os sub-cones (metade do raio máximo) cobrem o cone original com
+        sobreposição; os resultados são unidos, deduplicados pelo identificador
+        principal e recortados ao raio pedido.
+        """
+        from astropy.table import unique, vstack
+        
+        raio_sub = self.raio_max_cone / 2
+        sub_coords = self._centros_sub_cones(coord, self.radius, raio_sub)
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            tabelas = list(executor.map(
+                lambda centro: self._consultar_cone_simbad(centro, raio_sub), sub_coords))
+        
+        tabelas = [t for t in tabelas if t is not None and len(t) > 0]
+        if not tabelas:
+            return None
+        
+        result_table = vstack(tabelas)
+        result_table = unique(result_table, keys='MAIN_ID')
+        
+        separacoes = coord.separation(self._coords_tabela_simbad(result_table))
+        return result_table[separacoes <= self.radius]
+    
+    @staticmethod
+    def _centros_sub_cones(coord, raio, raio_sub):
+        """
+        Centros de uma grade de sub-cones de raio raio_sub cobrindo o cone (coord, raio)
+        
+        Espaçamento raio_sub·√2: o quadrado inscrito em cada sub-cone ladrilha o plano.
+        """
+        from astropy import units as u
+        
+        passo = (raio_sub * np.sqrt(2)).to_value(u.arcsec)
+        r = raio.to_value(u.arcsec)
+        n = int(np.ceil(r / passo))
+        dx, dy = np.meshgrid(np.arange(-n, n + 1) * passo, np.arange(-n, n + 1) * passo)
+        distancias = np.hypot(dx, dy)
+        
+        # Só os sub-cones que alcançam o cone original
+        dentro = distancias < r + raio_sub.to_value(u.arcsec)
+        return coord.directional_offset_by(
+            np.arctan2(dx[dentro], dy[dentro]) * u.rad,
+            distancias[dentro] * u.arcsec
+        )
+    
+    def verificar_simbad_lote(self, ras, decs):
+        """
+        Verificação SIMBAD de várias coordenadas com uma única consulta
+        
+        Args:
+            ras: Sequência de Ascensões Retas em graus
+            decs: Sequência de Declinações em graus
             
-            objetos = []
-            for row in result_table:
-                obj_coord = SkyCoord(ra=row['RA'], dec=row['DEC'], unit=(u.hourangle, u.deg))
-                separacao = coord.separation(obj_coord)
-                
-                try:
-                    bibcodes = self.simbad.query_bibobj(row['MAIN_ID'])
-                    n_refs = len(bibcodes) if bibcodes is not None else 0
-                except:
-                    n_refs = 0
-                
-                objeto = {
-                    'nome': str(row['MAIN_ID']),
-                    'tipo': str(row['OTYPE']) if 'OTYPE' in row.colnames else 'Unknown',
-                    'ra': obj_coord.ra.deg,
-                    'dec': obj_coord.dec.deg,
-                    'separacao_arcsec': separacao.arcsec,
-                    'mag_v': float(row['FLUX_V']) if row['FLUX_V'] and not np.ma.is_masked(row['FLUX_V']) else None,
-                    'tipo_espectral': str(row['SP_TYPE']) if 'SP_TYPE' in row.colnames and row['SP_TYPE'] else None,
-                    'referencias': n_refs,
-                    'identificadores': str(row['IDS']) if 'IDS' in row.colnames else row['MAIN_ID']
-                }
-                objetos.append(objeto)
+        Returns:
+            list de dicts no mesmo formato de verificar_simbad_completo, um por coordenada
+        """
+        ras = np.atleast_1d(np.asarray(ras, dtype=float))
+        decs = np.atleast_1d(np.asarray(decs, dtype=float))
+        
+        try:
+            centros = _criar_coord(ras, decs)
+            result_table = _colunas_maiusculas(
+                _consultar_remoto(self.simbad.query_region, centros, radius=self.radius))
             
-            objetos.sort(key=lambda x: x['separacao_arcsec'])
+            if result_table is None or len(result_table) == 0:
+                return [self._resultado_simbad(ra, dec, centro, None)
+                        for ra, dec, centro in zip(ras, decs, centros)]
             
-            if len(objetos) > 0:
-                obj_mais_proximo = objetos[0]
-                if obj_mais_proximo['separacao_arcsec'] < 5:
-                    status = 'CONHECIDA'
-                elif obj_mais_proximo['separacao_arcsec'] < 30:
-                    status = 'CANDIDATA'
-                else:
-                    status = 'CAMPO_ESTELAR'
-            else:
-                status = 'POTENCIAL_NOVA'
+            # Devolver cada objeto às coordenadas de entrada em cujo cone ele cai
+            obj_coords = self._coords_tabela_simbad(result_table)
+            idx_obj, idx_centro, sep2d, _ = centros.search_around_sky(obj_coords, self.radius)
+            separacoes = sep2d.arcsec
+            status = self._status_por_alvo(len(ras), idx_centro, separacoes)
             
-            return {
-                'encontrado': True,
-                'total_objetos': len(objetos),
-                'objetos': objetos,
-                'objeto_principal': objetos[0] if objetos else None,
-                'status': status,
-                'coord_busca': f"{ra:.6f}, {dec:.6f}"
-            }
+            resultados = []
+            for k, (ra, dec, centro) in enumerate(zip(ras, decs, centros)):
+                do_alvo = idx_centro == k
+                resultados.append(self._resultado_simbad(ra, dec, centro, result_table[idx_obj[do_alvo]],
+                                                         separacoes[do_alvo], status[k]))
+            return resultados
             
         except Exception as e:
+            return [self._erro_simbad(ra, dec, e) for ra, dec in zip(ras, decs)]
+    
+    def _resultado_simbad(self, ra, dec, coord, result_table, separacoes=None, status=None, limite=None):
+        """
+        Monta o resultado de verificação a partir da tabela SIMBAD de um cone
+        
+        As consultas em lote passam separacoes (arcsec, alinhadas às linhas) e status
+        já calculados para todos os alvos de uma vez. limite é o número máximo de
+        linhas pedido à consulta: se a tabela chegou nele, total_objetos é só um
+        mínimo (total_limitado=True).
+        """
+        coord_busca = f"{ra:.6f}, {dec:.6f}"
+        
+        if result_table is None or len(result_table) == 0:
             return {
                 'encontrado': False,
                 'total_objetos': 0,
                 'objetos': [],
-                'status': 'ERRO',
-                'erro': str(e),
-                'coord_busca': f"{ra:.6f}, {dec:.6f}"
+                'status': 'POTENCIAL_NOVA',
+                'coord_busca': coord_busca
             }
+        
+        # Contagem de referências: coluna nbref (maiúscula ou não, conforme a versão)
+        # ou BIBLIST* do campo bibcodelist
+        coluna_refs = next((c for c in result_table.colnames
+                            if c.upper() == 'NBREF' or c.upper().startswith('BIBLIST')), None)
+        
+        # Coordenadas e separações de todos os objetos de uma vez, já em ordem de distância
+        obj_coords = self._coords_tabela_simbad(result_table)
+        if separacoes is None:
+            separacoes = coord.separation(obj_coords).arcsec
+        obj_ras = obj_coords.ra.deg
+        obj_decs = obj_coords.dec.deg
+        
+        ordem = np.argsort(separacoes, kind='stable')
+        
+        # Colunas com máscara resolvida uma vez para a tabela inteira (sem Row por objeto)
+        nomes = _coluna_texto(result_table, 'MAIN_ID')
+        tipos = _coluna_texto(result_table, 'OTYPE')
+        tipos_espectrais = _coluna_texto(result_table, 'SP_TYPE', padrao='', mascarado='')
+        identificadores = _coluna_texto(result_table, 'IDS', padrao=None)
+        mags_v = _coluna_float(result_table, 'FLUX_V')
+        if coluna_refs is None:
+            refs = self._referencias_sem_nbref(result_table)
+        elif result_table[coluna_refs].dtype.kind in 'fiu':
+            refs = _coluna_float(result_table, coluna_refs, preenchimento=0).astype(int)
+        else:
+            # Lista de bibcodes separados por '|'
+            refs = [len(lista.split('|')) if lista else 0
+                    for lista in _coluna_texto(result_table, coluna_refs, padrao='', mascarado='')]
+        
+        objetos = []
+        for i in ordem:
+            objeto = {
+                'nome': nomes[i],
+                'tipo': tipos[i],
+                'ra': obj_ras[i],
+                'dec': obj_decs[i],
+                'separacao_arcsec': separacoes[i],
+                'mag_v': None if np.isnan(mags_v[i]) else float(mags_v[i]),
+                'tipo_espectral': tipos_espectrais[i] or None,
+                'referencias': int(refs[i]),
+                'identificadores': identificadores[i] or nomes[i]
+            }
+            objetos.append(objeto)
+        
+        if status is None:
+            status = _status_separacao(separacoes[ordem[0]])
+        
+        return {
+            'encontrado': True,
+            'total_objetos': len(objetos),
+            'total_limitado': limite is not None and len(objetos) >= limite,
+            'objetos': objetos,
+            'objeto_principal': objetos[0] if objetos else None,
+            'status': str(status),
+            'coord_busca': coord_busca
+        }
     
-    def verificar_exoplanetas(self, ra, dec):
+    def _status_por_alvo(self, n_alvos, indices, separacoes):
+        """Status SIMBAD de cada alvo de um lote (indices: alvo de cada linha cruzada)"""
+        separacoes_min = np.full(n_alvos, np.inf)
+        np.minimum.at(separacoes_min, indices, separacoes)
+        return _status_separacao(separacoes_min)
+    
+    def _referencias_sem_nbref(self, result_table):
+        """
+        Número de referências dos objetos de uma tabela SIMBAD que veio sem nbref
+        
+        Uma única consulta TAP traz a contagem de todos os objetos; se ela falhar,
+        todos ficam com 0.
+        """
+        nomes = [str(nome) for nome in result_table['MAIN_ID']]
+        refs = np.zeros(len(nomes), dtype=int)
+        
+        try:
+            lista = ', '.join("'" + nome.replace("'", "''") + "'" for nome in set(nomes))
+            tabela = _consultar_remoto(self.simbad.query_tap,
+                                       f"SELECT main_id, nbref FROM basic WHERE main_id IN ({lista})")
+            refs_por_nome = dict(zip((str(n) for n in tabela['main_id']),
+                                     _coluna_float(tabela, 'nbref', preenchimento=0).astype(int)))
+            refs[:] = [refs_por_nome.get(nome, 0) for nome in nomes]
+        except:
+            pass
+        
+        return refs
+    
+    @staticmethod
+    def _coords_tabela_simbad(result_table):
+        """SkyCoord vetorial com as posições de todas as linhas de uma tabela SIMBAD"""
+        from astropy.coordinates import SkyCoord
+        from astropy import units as u
+        
+        ras, decs = result_table['RA'], result_table['DEC']
+        if ras.dtype.kind in 'fi':
+            return SkyCoord(ra=np.asarray(ras), dec=np.asarray(decs), unit=(u.deg, u.deg))
+        # Formato sexagesimal ('hh mm ss', '+dd mm ss')
+        return SkyCoord(ra=ras, dec=decs, unit=(u.hourangle, u.deg))
+    
+    def _erro_simbad(self, ra, dec, erro):
+        """Resultado de verificação SIMBAD quando a consulta falha"""
+        return {
+            'encontrado': False,
+            'total_objetos': 0,
+            'objetos': [],
+            'status': 'ERRO',
+            'erro': str(erro),
+            'coord_busca': f"{ra:.6f}, {dec:.6f}"
+        }
+    
+    @_cache_em_disco
+    def verificar_exoplanetas(self, ra, dec, coord=None):
         """Verifica se há exoplanetas conhecidos nas coordenadas"""
         try:
-            coord = SkyCoord(ra=ra*u.degree, dec=dec*u.degree, frame='icrs')
-            catalogos_exoplanetas = ['B/exopl', 'V/150', 'J/ApJS/197/8']
-            planetas_encontrados = []
-            
-            for catalogo in catalogos_exoplanetas:
-                try:
-                    result = self.vizier.query_region(coord, radius=self.radius, catalog=catalogo)
-                    if result and len(result) > 0:
-                        for table in result:
-                            for row in table:
-                                planetas_encontrados.append({'catalogo': catalogo, 'dados': dict(row)})
-                except:
-                    continue
+            if coord is None:
+                coord = _criar_coord(ra, dec)
+            # Uma única requisição para todos os catálogos
+            result = self._consultar_vizier(self.vizier, coord, CATALOGOS_EXOPLANETAS)
+            planetas_encontrados = [
+                {'catalogo': catalogo, 'tabela': table, 'linha': i}
+                for catalogo, table in self._tabelas_por_catalogo(result, CATALOGOS_EXOPLANETAS)
+                for i in range(len(table))
+            ]
             
             return {
                 'encontrado': len(planetas_encontrados) > 0,
@@ -133,47 +667,36 @@ class CDSProfessionalChecker:
         except Exception as e:
             return {'encontrado': False, 'total_planetas': 0, 'planetas': [], 'erro': str(e)}
     
-    def verificar_variaveis(self, ra, dec):
+    @_cache_em_disco
+    def verificar_variaveis(self, ra, dec, coord=None):
         """Verifica se há estrelas variáveis conhecidas"""
         try:
-            coord = SkyCoord(ra=ra*u.degree, dec=dec*u.degree, frame='icrs')
-            result = self.vizier.query_region(coord, radius=self.radius, catalog='B/vsx')
+            if coord is None:
+                coord = _criar_coord(ra, dec)
+            result = self._consultar_vizier(self.vizier_vsx, coord, 'B/vsx')
             
-            if not result or len(result) == 0:
+            if not result:
                 return {'encontrado': False, 'total_variaveis': 0, 'variaveis': []}
             
-            variaveis = []
-            for table in result:
-                for row in table:
-                    variavel = {
-                        'nome': str(row['Name']) if 'Name' in row.colnames else 'Unknown',
-                        'tipo': str(row['Type']) if 'Type' in row.colnames else 'Unknown',
-                        'periodo': float(row['Period']) if 'Period' in row.colnames and not np.ma.is_masked(row['Period']) else None,
-                        'max_mag': float(row['max']) if 'max' in row.colnames and not np.ma.is_masked(row['max']) else None,
-                        'min_mag': float(row['min']) if 'min' in row.colnames and not np.ma.is_masked(row['min']) else None,
-                    }
-                    variaveis.append(variavel)
+            variaveis = [v for _, table in result for v in self._registros_variaveis(table)]
             
             return {'encontrado': True, 'total_variaveis': len(variaveis), 'variaveis': variaveis}
         except Exception as e:
             return {'encontrado': False, 'total_variaveis': 0, 'variaveis': [], 'erro': str(e)}
     
-    def verificar_transientes(self, ra, dec):
+    @_cache_em_disco
+    def verificar_transientes(self, ra, dec, coord=None):
         """Verifica transientes conhecidos"""
         try:
-            coord = SkyCoord(ra=ra*u.degree, dec=dec*u.degree, frame='icrs')
-            catalogos = ['VII/282', 'B/sn']
-            transientes = []
-            
-            for catalogo in catalogos:
-                try:
-                    result = self.vizier.query_region(coord, radius=self.radius, catalog=catalogo)
-                    if result and len(result) > 0:
-                        for table in result:
-                            for row in table:
-                                transientes.append({'catalogo': catalogo, 'dados': dict(row)})
-                except:
-                    continue
+            if coord is None:
+                coord = _criar_coord(ra, dec)
+            # Uma única requisição para todos os catálogos
+            result = self._consultar_vizier(self.vizier, coord, CATALOGOS_TRANSIENTES)
+            transientes = [
+                {'catalogo': catalogo, 'tabela': table, 'linha': i}
+                for catalogo, table in self._tabelas_por_catalogo(result, CATALOGOS_TRANSIENTES)
+                for i in range(len(table))
+            ]
             
             return {
                 'encontrado': len(transientes) > 0,
@@ -183,42 +706,373 @@ class CDSProfessionalChecker:
         except Exception as e:
             return {'encontrado': False, 'total_transientes': 0, 'transientes': [], 'erro': str(e)}
     
-    def verificacao_completa(self, ra, dec, tipo_deteccao='all'):
-        """Verificação completa em múltiplos catálogos"""
+    @staticmethod
+    def _registros_variaveis(table):
+        """Registros de estrelas variáveis de uma tabela VSX (colunas convertidas de uma vez)"""
+        return [
+            {'nome': nome, 'tipo': tipo, 'periodo': periodo, 'max_mag': mag_max, 'min_mag': mag_min}
+            for nome, tipo, periodo, mag_max, mag_min in zip(
+                _coluna_texto(table, 'Name'), _coluna_texto(table, 'Type'),
+                _coluna_opcional(table, 'Period'), _coluna_opcional(table, 'max'),
+                _coluna_opcional(table, 'min')
+            )
+        ]
+    
+    def _consultar_vizier(self, cliente, coord, catalog):
+        """
+        Consulta o VizieR pedindo TSV (resposta bem menor que VOTable)
+        
+        Se a resposta TSV não puder ser interpretada, repete a consulta em VOTable.
+        Falhas de rede não levam ao VOTable: sobem para o chamador, depois das
+        novas tentativas de _consultar_remoto.
+        
+        Returns:
+            Lista de pares (nome da tabela, Table)
+        """
+        from astroquery.exceptions import TableParseError
+        
+        # O astroquery lê o TSV dentro do próprio query_region, então só os erros
+        # de leitura (ValueError inclui o InconsistentTableError do astropy) são pegos
+        try:
+            tabelas = _consultar_remoto(cliente.query_region, coord, radius=self.radius,
+                                        catalog=catalog, return_type='asu-tsv')
+            if tabelas is not None:  # None: resposta que o astroquery não reconheceu
+                return [self._limpar_tabela_tsv(table) for table in tabelas]
+        except (TableParseError, ValueError):
+            pass
+        
+        result = _consultar_remoto(cliente.query_region, coord, radius=self.radius, catalog=catalog)
+        return list(zip(result.keys(), result.values())) if result else []
+    
+    @staticmethod
+    def _limpar_tabela_tsv(table):
+        """
+        Ajusta uma tabela TSV do VizieR lida pelo astroquery
+        
+        O parser do astroquery mantém as linhas de unidades e de separador ('----')
+        como dados e lê tudo como texto: aqui elas são removidas, as colunas numéricas
+        convertidas (células vazias viram valores mascarados) e o nome da tabela
+        recuperado dos comentários '#Name:'.
+        """
+        from astropy.table import MaskedColumn
+        
+        nomes = [c[len('Name: '):] for c in table.meta.get('comments', []) if c.startswith('Name: ')]
+        if not nomes or len(table) < 2 or not all(set(str(v).strip()) <= {'-'} for v in table[1]):
+            raise ValueError('Formato TSV inesperado')
+        
+        table = table[2:]
+        for coluna in table.colnames:
+            valores = np.char.strip(np.asarray(table[coluna], dtype=str))
+            vazios = valores == ''
+            preenchidos = np.where(vazios, '0', valores)
+            for tipo in (int, float):
+                try:
+                    numeros = preenchidos.astype(tipo)
+                except ValueError:
+                    continue
+                table[coluna] = MaskedColumn(numeros, mask=vazios) if vazios.any() else numeros
+                break
+        
+        return nomes[-1], table
+    
+    @staticmethod
+    def dataframe_catalogo(itens):
+        """
+        Linhas de catálogo (planetas ou transientes) num único DataFrame
+        
+        Cada tabela é convertida de uma vez com to_pandas, só nas linhas referenciadas;
+        a coluna 'Catálogo' indica a origem. Colunas ausentes numa tabela ficam vazias.
+        """
+        import pandas as pd
+        
+        por_tabela = {}
+        for item in itens:
+            catalogo, table, linhas = por_tabela.setdefault(id(item['tabela']),
+                                                            (item['catalogo'], item['tabela'], []))
+            linhas.append(item['linha'])
+        
+        partes = []
+        for catalogo, table, linhas in por_tabela.values():
+            df = table[linhas].to_pandas(index=False)
+            df.insert(0, 'Catálogo', catalogo)
+            partes.append(df)
+        return pd.concat(partes, ignore_index=True) if partes else pd.DataFrame()
+    
+    @staticmethod
+    def _tabelas_por_catalogo(result, catalogos):
+        """
+        Associa cada tabela (nome, Table) devolvida pelo VizieR ao catálogo consultado de origem
+        
+        As tabelas guardadas nos resultados (e nos caches) ficam só com as colunas
+        que têm algum valor: os catálogos consultados com '*' trazem muitas colunas
+        totalmente vazias perto do alvo.
+        """
+        return [
+            (next((c for c in catalogos if nome.startswith(c)), nome), _sem_colunas_vazias(table))
+            for nome, table in result
+        ]
+    
+    def verificacao_completa(self, ra, dec, tipo_deteccao='all', resultado_simbad=None, coord=None,
+                             fast_path=False, force=True):
+        """
+        Verificação completa em múltiplos catálogos
+        
+        As consultas aos catálogos são independentes e limitadas pela rede, então
+        rodam ao mesmo tempo no pool de threads do verificador
+        
+        Args:
+            ra: Ascensão Reta em graus
+            dec: Declinação em graus
+            tipo_deteccao: 'planeta', 'variavel', 'transiente' ou 'all'
+            resultado_simbad: Resultado de verificar_simbad_completo já obtido para
+                estas coordenadas (evita repetir a consulta SIMBAD)
+            coord: SkyCoord já construído para (ra, dec), se disponível
+            fast_path: Consultar o SIMBAD primeiro e, se o alvo coincidir com um objeto
+                bem estudado (< 5 arcsec, > 50 referências), classificar sem consultar
+                os catálogos VizieR
+            force: Consultar todos os catálogos do tipo_deteccao. Com False, se o SIMBAD
+                tiver um objeto a < 1 arcsec do alvo, só o catálogo indicado pelo tipo
+                dele (VERIFICACOES_POR_OTYPE) é consultado; os outros ficam None
+        """
         resultado = {
             'coordenadas': {'ra': ra, 'dec': dec},
-            'simbad': None,
+            'simbad': resultado_simbad,
             'exoplanetas': None,
             'variaveis': None,
             'transientes': None,
             'classificacao_final': None
         }
         
-        print("Verificando SIMBAD...")
-        resultado['simbad'] = self.verificar_simbad_completo(ra, dec)
+        # Um único SkyCoord compartilhado por todas as consultas
+        if coord is None:
+            coord = _criar_coord(ra, dec)
+        
+        # Os atalhos decidem a partir do SIMBAD, que então é consultado antes
+        if (fast_path or not force) and resultado_simbad is None:
+            print("Verificando SIMBAD...")
+            resultado_simbad = self.verificar_simbad_completo(ra, dec, coord=coord)
+            resultado['simbad'] = resultado_simbad
+        
+        # Objeto conhecido e muito estudado: os catálogos não mudam a conclusão
+        if fast_path and self._identificacao_obvia(resultado_simbad):
+            resultado['classificacao_final'] = self._classificar_resultado(resultado)
+            return resultado
+        
+        relevantes = None if force else self._verificacoes_relevantes(resultado_simbad)
+        
+        consultas = {}
+        if resultado_simbad is None:
+            consultas['simbad'] = ("Verificando SIMBAD...", self.verificar_simbad_completo)
         
         if tipo_deteccao in ['planeta', 'all']:
-            print("Verificando catálogos de exoplanetas...")
-            resultado['exoplanetas'] = self.verificar_exoplanetas(ra, dec)
+            consultas['exoplanetas'] = ("Verificando catálogos de exoplanetas...",
+                                        self.verificar_exoplanetas)
         
         if tipo_deteccao in ['variavel', 'cometa', 'all']:
-            print("Verificando catálogo de estrelas variáveis...")
-            resultado['variaveis'] = self.verificar_variaveis(ra, dec)
+            consultas['variaveis'] = ("Verificando catálogo de estrelas variáveis...",
+                                      self.verificar_variaveis)
         
         if tipo_deteccao in ['transiente', 'supernova', 'all']:
-            print("Verificando catálogos de transientes...")
-            resultado['transientes'] = self.verificar_transientes(ra, dec)
+            consultas['transientes'] = ("Verificando catálogos de transientes...",
+                                        self.verificar_transientes)
+        
+        if relevantes is not None:
+            consultas = {nome: consulta for nome, consulta in consultas.items()
+                         if nome == 'simbad' or nome in relevantes}
+        
+        # Avisos impressos aqui, na thread chamadora, antes de disparar as consultas
+        futuros = {}
+        for nome, (mensagem, consulta) in consultas.items():
+            print(mensagem)
+            futuros[nome] = self._executor.submit(consulta, ra, dec, coord=coord)
+        for nome, futuro in futuros.items():
+            resultado[nome] = futuro.result()
         
         resultado['classificacao_final'] = self._classificar_resultado(resultado)
         
         return resultado
     
+    def verificacao_completa_batch(self, ras, decs, tipo_deteccao='all'):
+        """
+        Verificação completa de muitas coordenadas com uma consulta por serviço
+        
+        As coordenadas são enviadas juntas: ao SIMBAD como tabela TAP_UPLOAD
+        cruzada no servidor, e ao VizieR como lista de centros (coluna _q indica
+        o alvo de cada linha). O número de requisições não cresce com o número
+        de alvos; cada resultado é classificado individualmente depois.
+        
+        Args:
+            ras: Sequência de Ascensões Retas em graus
+            decs: Sequência de Declinações em graus
+            tipo_deteccao: 'planeta', 'variavel', 'transiente' ou 'all'
+            
+        Returns:
+            list de dicts no formato de verificacao_completa, um por coordenada
+        """
+        ras = np.atleast_1d(np.asarray(ras, dtype=float))
+        decs = np.atleast_1d(np.asarray(decs, dtype=float))
+        centros = _criar_coord(ras, decs)
+        
+        resultados = [
+            {
+                'coordenadas': {'ra': float(ra), 'dec': float(dec)},
+                'simbad': resultado_simbad,
+                'exoplanetas': None,
+                'variaveis': None,
+                'transientes': None,
+                'classificacao_final': None
+            }
+            for ra, dec, resultado_simbad in zip(ras, decs, self._simbad_upload(ras, decs, centros))
+        ]
+        
+        def itens_catalogo(tabelas):
+            return [{'catalogo': catalogo, 'tabela': table, 'linha': i}
+                    for catalogo, table in tabelas for i in range(len(table))]
+        
+        def itens_variaveis(tabelas):
+            return [v for _, table in tabelas for v in self._registros_variaveis(table)]
+        
+        # Sem limite de linhas: o corte seria global, não por alvo
+        verificacoes = []
+        if tipo_deteccao in ['planeta', 'all']:
+            verificacoes.append(('exoplanetas', 'total_planetas', 'planetas',
+                                 _get_vizier(row_limit=-1),
+                                 CATALOGOS_EXOPLANETAS, itens_catalogo))
+        if tipo_deteccao in ['variavel', 'cometa', 'all']:
+            verificacoes.append(('variaveis', 'total_variaveis', 'variaveis',
+                                 _get_vizier(COLUNAS_VSX, row_limit=-1), ['B/vsx'], itens_variaveis))
+        if tipo_deteccao in ['transiente', 'supernova', 'all']:
+            verificacoes.append(('transientes', 'total_transientes', 'transientes',
+                                 _get_vizier(row_limit=-1),
+                                 CATALOGOS_TRANSIENTES, itens_catalogo))
+        
+        for nome, chave_total, chave_lista, cliente, catalogos, itens in verificacoes:
+            try:
+                por_alvo = self._vizier_por_alvo(cliente, centros, catalogos)
+            except Exception as e:
+                for resultado in resultados:
+                    resultado[nome] = {'encontrado': False, chave_total: 0, chave_lista: [], 'erro': str(e)}
+                continue
+            
+            for resultado, tabelas in zip(resultados, por_alvo):
+                lista = itens(tabelas)
+                resultado[nome] = {'encontrado': len(lista) > 0, chave_total: len(lista), chave_lista: lista}
+        
+        for resultado in resultados:
+            resultado['classificacao_final'] = self._classificar_resultado(resultado)
+        
+        return resultados
+    
+    def _simbad_upload(self, ras, decs, centros):
+        """
+        Resultados SIMBAD de várias coordenadas com um único cruzamento TAP_UPLOAD
+        
+        Se o TAP falhar, usa a consulta em lote por query_region (verificar_simbad_lote).
+        """
+        from astropy.table import Table
+        
+        try:
+            alvos = Table({'indice': np.arange(len(ras)), 'ra': ras, 'dec': decs})
+            adql = ADQL_LOTE_SIMBAD.format(raio=self.radius.to_value('deg'))
+            tabela = _consultar_remoto(self.simbad.query_tap, adql, alvos=alvos)
+            indices = np.asarray(tabela['INDICE'], dtype=int)
+            
+            # Separações de todas as linhas cruzadas numa só chamada
+            separacoes = (centros[indices].separation(self._coords_tabela_simbad(tabela)).arcsec
+                          if len(tabela) else np.zeros(0))
+            status = self._status_por_alvo(len(ras), indices, separacoes)
+            
+            resultados = []
+            for k, (ra, dec, centro) in enumerate(zip(ras, decs, centros)):
+                do_alvo = indices == k
+                resultados.append(self._resultado_simbad(ra, dec, centro, tabela[do_alvo],
+                                                         separacoes[do_alvo], status[k]))
+            return resultados
+        except Exception:
+            return self.verificar_simbad_lote(ras, decs)
+    
+    def _vizier_por_alvo(self, cliente, centros, catalogos):
+        """
+        Consulta VizieR com vários centros de uma vez, separando as tabelas por alvo
+        
+        Returns:
+            list (um item por centro) de listas de pares (catálogo, Table)
+        """
+        por_alvo = [[] for _ in range(len(centros))]
+        result = self._consultar_vizier(cliente, centros, catalogos)
+        
+        for catalogo, table in self._tabelas_por_catalogo(result, catalogos):
+            # _q: posição (começando em 1) do centro na lista enviada
+            alvos = (np.asarray(table['_q'], dtype=int) - 1 if '_q' in table.colnames
+                     else np.zeros(len(table), dtype=int))
+            for k in np.unique(alvos):
+                por_alvo[k].append((catalogo, table[alvos == k]))
+        
+        return por_alvo
+    
+    def verificar_lote(self, coords, tipo_deteccao='all', max_workers=4):
+        """
+        Verificação completa de vários alvos
+        
+        O SIMBAD é consultado uma única vez para todos os alvos (verificar_simbad_lote);
+        as verificações nos catálogos rodam em paralelo por alvo, dentro do limite
+        de consultas por segundo imposto por _consultar_remoto.
+        
+        Args:
+            coords: Sequência de pares (ra, dec) em graus
+            tipo_deteccao: 'planeta', 'variavel', 'transiente' ou 'all'
+            max_workers: Número de alvos verificados ao mesmo tempo
+            
+        Returns:
+            list com o resultado de verificacao_completa de cada alvo, na ordem de coords
+        """
+        coords = [(float(ra), float(dec)) for ra, dec in coords]
+        if not coords:
+            return []
+        
+        ras, decs = zip(*coords)
+        resultados_simbad = self.verificar_simbad_lote(ras, decs)
+        
+        def verificar(alvo):
+            (ra, dec), resultado_simbad = alvo
+            # Falha na consulta em lote: o alvo refaz a consulta SIMBAD sozinho
+            if resultado_simbad['status'] == 'ERRO':
+                resultado_simbad = None
+            return self.verificacao_completa(ra, dec, tipo_deteccao=tipo_deteccao,
+                                             resultado_simbad=resultado_simbad)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(verificar, zip(coords, resultados_simbad)))
+    
+    @staticmethod
+    def _verificacoes_relevantes(resultado_simbad):
+        """
+        Verificações de catálogo que ainda importam dado o objeto SIMBAD do alvo
+        
+        Returns:
+            set com no máximo um de 'exoplanetas'/'variaveis'/'transientes' se houver
+            objeto a < SEPARACAO_IDENTIDADE do alvo; None (todas) caso contrário
+        """
+        obj = resultado_simbad.get('objeto_principal')
+        if obj is None or obj['separacao_arcsec'] >= SEPARACAO_IDENTIDADE:
+            return None
+        verificacao = VERIFICACOES_POR_OTYPE.get(str(obj['tipo']).strip())
+        return {verificacao} if verificacao else set()
+    
+    @staticmethod
+    def _identificacao_obvia(resultado_simbad):
+        """Objeto SIMBAD mais próximo a < 5 arcsec e com mais de 50 referências"""
+        obj = resultado_simbad.get('objeto_principal')
+        return (obj is not None and _faixa_separacao(obj['separacao_arcsec']) == 0
+                and obj['referencias'] > 50)
+    
     def _classificar_resultado(self, resultado):
         """Classificação final baseada em todos os resultados - RIGOROSA"""
         
         status_simbad = resultado['simbad']['status']
         total_objetos_simbad = resultado['simbad']['total_objetos']
         obj_principal = resultado['simbad'].get('objeto_principal')
+        faixa = _faixa_separacao(obj_principal['separacao_arcsec']) if obj_principal else None
         
         # Verificar se há planetas conhecidos
         tem_planetas_conhecidos = (resultado['exoplanetas'] and 
@@ -249,7 +1103,7 @@ class CDSProfessionalChecker:
             }
         
         # CASO 2: Objeto MUITO próximo no SIMBAD (< 5 arcsec) = Mesmo objeto
-        if obj_principal and obj_principal['separacao_arcsec'] < 5:
+        if faixa == 0:
             obj_nome = obj_principal['nome']
             obj_tipo = obj_principal['tipo']
             obj_refs = obj_principal['referencias']
@@ -297,7 +1151,7 @@ class CDSProfessionalChecker:
                 }
         
         # CASO 3: Objeto moderadamente próximo (5-30 arcsec) = Pode ser mesmo objeto ou campo
-        if obj_principal and 5 <= obj_principal['separacao_arcsec'] < 30:
+        if faixa == 1:
             return {
                 'status': 'CANDIDATA',
                 'prioridade': 3,
@@ -306,7 +1160,7 @@ class CDSProfessionalChecker:
             }
         
         # CASO 4: Objeto distante (30-120 arcsec) = Campo estelar
-        if obj_principal and 30 <= obj_principal['separacao_arcsec'] < 120:
+        if faixa == 2:
             return {
                 'status': 'CAMPO_ESTELAR',
                 'prioridade': 4,
@@ -315,11 +1169,11 @@ class CDSProfessionalChecker:
             }
         
         # CASO 5: Apenas objetos muito distantes encontrados
-        if total_objetos_simbad > 0 and (not obj_principal or obj_principal['separacao_arcsec'] >= 120):
+        if total_objetos_simbad > 0 and faixa in (None, 3):
             return {
                 'status': 'CANDIDATA_FORTE',
                 'prioridade': 4,
-                'mensagem': f"🟢 {total_objetos_simbad} objetos no campo mas TODOS muito distantes (>120 arcsec)",
+                'mensagem': f"🟢 {_texto_total_objetos(resultado['simbad'])} objetos no campo mas TODOS muito distantes (>120 arcsec)",
                 'recomendacao': 'Nenhum objeto próximo conhecido. Alta probabilidade de descoberta nova!'
             }
         
@@ -333,53 +1187,53 @@ class CDSProfessionalChecker:
     
     def gerar_relatorio_profissional(self, resultado):
         """Gera relatório profissional completo"""
-        relatorio = "## 📊 Relatório de Verificação Profissional CDS\n\n"
+        partes = ["## 📊 Relatório de Verificação Profissional CDS\n\n"]
         
         coord = resultado['coordenadas']
-        relatorio += f"**Coordenadas:** RA={coord['ra']:.6f}°, Dec={coord['dec']:.6f}°\n\n"
+        partes.append(f"**Coordenadas:** RA={coord['ra']:.6f}°, Dec={coord['dec']:.6f}°\n\n")
         
         classificacao = resultado['classificacao_final']
-        relatorio += f"### Status: {classificacao['status']}\n"
-        relatorio += f"**Prioridade:** {classificacao['prioridade']}/5\n\n"
-        relatorio += f"**{classificacao['mensagem']}**\n\n"
-        relatorio += f"*Recomendação:* {classificacao['recomendacao']}\n\n"
+        partes.append(f"### Status: {classificacao['status']}\n")
+        partes.append(f"**Prioridade:** {classificacao['prioridade']}/5\n\n")
+        partes.append(f"**{classificacao['mensagem']}**\n\n")
+        partes.append(f"*Recomendação:* {classificacao['recomendacao']}\n\n")
         
         simbad = resultado['simbad']
-        relatorio += "---\n### 🔍 SIMBAD\n"
-        relatorio += f"**Objetos encontrados:** {simbad['total_objetos']}\n\n"
+        partes.append("---\n### 🔍 SIMBAD\n")
+        partes.append(f"**Objetos encontrados:** {_texto_total_objetos(simbad)}\n\n")
         
         if simbad['total_objetos'] > 0:
             obj = simbad['objeto_principal']
-            relatorio += "**Objeto mais próximo:**\n"
-            relatorio += f"- Nome: {obj['nome']}\n"
-            relatorio += f"- Tipo: {obj['tipo']}\n"
-            relatorio += f"- Separação: {obj['separacao_arcsec']:.2f} arcsec\n"
-            relatorio += f"- Mag V: {obj['mag_v'] if obj['mag_v'] else 'N/A'}\n"
-            relatorio += f"- Tipo Espectral: {obj['tipo_espectral'] if obj['tipo_espectral'] else 'N/A'}\n"
-            relatorio += f"- Referências: {obj['referencias']}\n\n"
+            partes.append("**Objeto mais próximo:**\n")
+            partes.append(f"- Nome: {obj['nome']}\n")
+            partes.append(f"- Tipo: {obj['tipo']}\n")
+            partes.append(f"- Separação: {obj['separacao_arcsec']:.2f} arcsec\n")
+            partes.append(f"- Mag V: {obj['mag_v'] if obj['mag_v'] else 'N/A'}\n")
+            partes.append(f"- Tipo Espectral: {obj['tipo_espectral'] if obj['tipo_espectral'] else 'N/A'}\n")
+            partes.append(f"- Referências: {obj['referencias']}\n\n")
         
         if resultado['exoplanetas']:
             exo = resultado['exoplanetas']
-            relatorio += "---\n### 🪐 Exoplanetas\n"
-            relatorio += f"**Planetas conhecidos:** {exo['total_planetas']}\n\n"
+            partes.append("---\n### 🪐 Exoplanetas\n")
+            partes.append(f"**Planetas conhecidos:** {exo['total_planetas']}\n\n")
             if exo['total_planetas'] > 0:
-                relatorio += "Este sistema planetário já é conhecido.\n\n"
+                partes.append("Este sistema planetário já é conhecido.\n\n")
         
         if resultado['variaveis']:
             var = resultado['variaveis']
-            relatorio += "---\n### ⭐ Estrelas Variáveis\n"
-            relatorio += f"**Variáveis conhecidas:** {var['total_variaveis']}\n\n"
+            partes.append("---\n### ⭐ Estrelas Variáveis\n")
+            partes.append(f"**Variáveis conhecidas:** {var['total_variaveis']}\n\n")
             if var['total_variaveis'] > 0:
                 for v in var['variaveis'][:3]:
-                    relatorio += f"- {v['nome']}: Tipo {v['tipo']}"
+                    partes.append(f"- {v['nome']}: Tipo {v['tipo']}")
                     if v['periodo']:
-                        relatorio += f", Período={v['periodo']:.2f}d"
-                    relatorio += "\n"
-                relatorio += "\n"
+                        partes.append(f", Período={v['periodo']:.2f}d")
+                    partes.append("\n")
+                partes.append("\n")
         
         if resultado['transientes']:
             trans = resultado['transientes']
-            relatorio += "---\n### 💥 Transientes\n"
-            relatorio += f"**Transientes conhecidos:** {trans['total_transientes']}\n\n"
+            partes.append("---\n### 💥 Transientes\n")
+            partes.append(f"**Transientes conhecidos:** {trans['total_transientes']}\n\n")
         
-        return relatorio
+        return ''.join(partes)
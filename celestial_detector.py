@@ -3,29 +3,258 @@ Detector de Corpos Celestes
 Identifica asteroides, cometas, planetas e objetos transientes em dados astronômicos
 """
 
+import math
+import warnings
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from scipy import signal
+from scipy.ndimage import uniform_filter1d, maximum_filter1d, minimum_filter1d
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy.stats import chi2
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Meteoros/eventos rápidos como array estruturado (mesmos campos dos dicts)
+METEOR_DTYPE = np.dtype([
+    ('detection_time', 'f8'),
+    ('peak_brightness', 'f8'),
+    ('duration_hours', 'f8'),
+    ('amplitude', 'f8'),
+    ('event_type', 'U16'),
+    ('confidence', 'f8'),
+])
+
+# Abaixo disso a cópia para a GPU custa mais que o periodograma na CPU
+MIN_POINTS_CUDA = 5000
+
+
+@lru_cache(maxsize=8)
+def _cuda_angular_grid(fmin: float, fmax: float, n_freq: int):
+    """Grade de frequências angulares já na GPU, reaproveitada entre chamadas"""
+    import cupy
+    return cupy.asarray(2 * np.pi * np.linspace(fmin, fmax, n_freq))
+
+
+def _lomb_scargle_cuda(time: np.ndarray, y: np.ndarray, frequency: np.ndarray) -> np.ndarray:
+    """Lomb-Scargle direto na GPU (cupyx.scipy.signal, ou cusignal em versões antigas)"""
+    import cupy
+    try:
+        from cupyx.scipy.signal import lombscargle
+    except ImportError:
+        from cusignal import lombscargle
+    
+    omega = _cuda_angular_grid(float(frequency[0]), float(frequency[-1]), len(frequency))
+    power = lombscargle(cupy.asarray(time), cupy.asarray(y - np.mean(y)), omega, normalize=True)
+    return cupy.asnumpy(power)
+
+
+def _lomb_scargle(time: np.ndarray, y: np.ndarray, frequency: np.ndarray,
+                  backend: str = 'cpu') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Periodograma Lomb-Scargle numa grade regular de frequências (ciclos por unidade de tempo)
+    
+    Usa NUFFT (nifty-ls) quando instalado; senão o método 'fast' do astropy
+    (extirpolação de Press & Rybicki + FFT), em O((N + Nf) log Nf) em vez de O(N·Nf).
+    Com backend='cuda' e séries longas, calcula na GPU se CuPy estiver disponível.
+    
+    Returns:
+        (frequências, potência normalizada)
+    """
+    if backend == 'cuda' and len(time) > MIN_POINTS_CUDA:
+        try:
+            return frequency, _lomb_scargle_cuda(time, y, frequency)
+        except ImportError:
+            pass  # Sem CuPy: segue na CPU
+        except Exception as e:
+            # CuPy instalado mas sem GPU/driver utilizável (CUDARuntimeError etc.)
+            warnings.warn(f"Lomb-Scargle na GPU falhou ({e}); seguindo na CPU", RuntimeWarning)
+    
+    try:
+        import nifty_ls
+        result = nifty_ls.lombscargle(time, y, fmin=frequency[0], fmax=frequency[-1],
+                                      Nf=len(frequency))
+        return result.freq(), result.power
+    except ImportError:
+        from astropy.timeseries import LombScargle
+        power = LombScargle(time, y).power(frequency, method='fast',
+                                           assume_regular_frequency=True)
+        return frequency, power
+
+
+def _as_float32(flux: np.ndarray) -> np.ndarray:
+    """
+    Fluxo contíguo em float32 para filtros e varreduras (metade da memória trafegada)
+    
+    Só o fluxo: tempos continuam em float64, pois datas BJD/BTJD em float32
+    perderiam resolução de segundos a minutos.
+    """
+    return np.ascontiguousarray(flux, dtype=np.float32)
+
+
+def _jit(func):
+    """Compila com Numba (nopython, cache em disco) quando disponível"""
+    return njit(cache=True)(func) if njit is not None else func
+
+
+@_jit
+def _scan_transients(flux_norm, time, threshold, min_dur, max_dur):
+    """
+    Varredura de eventos rápidos acima de 1 + threshold
+    
+    Cada evento começa num ponto acima de 1 + threshold e segue enquanto o fluxo
+    fica acima de 1 + threshold/2; só os com duração (horas) em [min_dur, max_dur]
+    são retornados. Apenas indexação escalar (máximo acumulado à mão), para rodar
+    em modo nopython.
+    
+    Returns:
+        (tempos do pico, fluxos do pico, durações em horas) como arrays paralelos
+    """
+    n = len(flux_norm)
+    peak_times = np.empty(n)
+    peak_fluxes = np.empty(n)
+    durations = np.empty(n)
+    n_events = 0
+    
+    i = 0
+    while i < n - 2:
+        if flux_norm[i] > 1 + threshold:
+            event_end = i
+            while event_end < n - 1 and flux_norm[event_end] > 1 + threshold / 2:
+                event_end += 1
+            
+            duration_hours = (time[event_end] - time[i]) * 24
+            if min_dur <= duration_hours <= max_dur:
+                peak = i
+                for j in range(i + 1, event_end + 1):
+                    if flux_norm[j] > flux_norm[peak]:
+                        peak = j
+                peak_times[n_events] = time[peak]
+                peak_fluxes[n_events] = flux_norm[peak]
+                durations[n_events] = duration_hours
+                n_events += 1
+            
+            i = event_end + 1
+        else:
+            i += 1
+    
+    return peak_times[:n_events], peak_fluxes[:n_events], durations[:n_events]
+
+
+@_jit
+def _median_std_kernel(flux):
+    """Mediana (seleção numa cópia) e desvio padrão populacional por Welford numa só varredura"""
+    mean = 0.0
+    m2 = 0.0
+    for i in range(len(flux)):
+        delta = flux[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (flux[i] - mean)
+    return np.median(flux), np.sqrt(m2 / len(flux))
+
+
+@_jit
+def _clean_and_normalize_kernel(time, flux, flux_median, limit, out_time, out_flux):
+    """Copia os pontos com |flux - mediana| < limit e normaliza pela nova mediana"""
+    n_kept = 0
+    for i in range(len(flux)):
+        if abs(flux[i] - flux_median) < limit:
+            out_time[n_kept] = time[i]
+            out_flux[n_kept] = flux[i]
+            n_kept += 1
+    
+    clean_median = np.median(out_flux[:n_kept])
+    for j in range(n_kept):
+        out_flux[j] /= clean_median
+    return n_kept
+
+
+def _clean_and_normalize(time: np.ndarray, flux: np.ndarray, flux_median: float,
+                         flux_std: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Remove outliers (> 5 sigma) e normaliza o fluxo pela mediana dos pontos restantes
+    
+    Com Numba, filtro, cópia e normalização são fundidos num kernel sobre buffers
+    pré-alocados; sem Numba, o mesmo cálculo com operações vetorizadas.
+    
+    Returns:
+        (tempos mantidos, fluxo normalizado)
+    """
+    if njit is None:
+        flux = _as_float32(flux)
+        mask = np.abs(flux - flux_median) < 5 * flux_std
+        flux_clean = flux[mask]
+        return time[mask], flux_clean / np.median(flux_clean)
+    
+    out_time = np.empty(len(time), dtype=np.float64)
+    out_flux = np.empty(len(flux), dtype=np.float32)
+    n_kept = _clean_and_normalize_kernel(np.ascontiguousarray(time, dtype=np.float64),
+                                         _as_float32(flux),
+                                         flux_median, 5 * flux_std, out_time, out_flux)
+    return out_time[:n_kept], out_flux[:n_kept]
+
+
+def _quantiles(values: np.ndarray, qs) -> np.ndarray:
+    """
+    Quantis (0-1) por interpolação linear, iguais aos de np.percentile
+    
+    Um único np.partition (introselect, O(N)) posiciona só as ordens vizinhas de
+    cada quantil, sem ordenar o array.
+    """
+    n = len(values)
+    positions = np.asarray(qs, dtype=np.float64) * (n - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    part = np.partition(values, np.unique(np.concatenate([lower, upper])))
+    weight = positions - lower
+    return part[lower] + (part[upper] - part[lower]) * weight
+
+
+def _transit_duration_kernel(time_in_transit: np.ndarray, periods: np.ndarray) -> np.ndarray:
+    """
+    Duração do trânsito (fração do período) para vários períodos candidatos de uma vez
+    
+    Dobra apenas os pontos em trânsito, vetorizado no eixo dos períodos (K x M),
+    e retorna o range de fases de cada candidato.
+    """
+    periods = np.asarray(periods, dtype=np.float64)
+    if time_in_transit.size == 0:
+        return np.zeros(len(periods))
+    
+    phase = np.remainder(time_in_transit[np.newaxis, :], periods[:, np.newaxis])
+    phase /= periods[:, np.newaxis]
+    return np.ptp(phase, axis=1)
+
 
 class CelestialBodyDetector:
     """Detecta e classifica diferentes tipos de corpos celestes"""
     
-    def __init__(self, sensitivity: float = 3.0):
+    def __init__(self, sensitivity: float = 3.0, backend: str = 'cpu'):
         """
         Args:
             sensitivity: Limiar de sensibilidade em sigmas para detecção
+            backend: 'cpu' ou 'cuda' (periodograma na GPU via CuPy, se instalado)
         """
         self.sensitivity = sensitivity
+        self.backend = backend
+        
+        # Grades de frequência do periodograma por (min_period, max_period, n_freq),
+        # reaproveitadas entre curvas de luz analisadas com a mesma configuração
+        self._ls_plan = {}
         
     def detect_transiting_planets(
         self, 
         time: np.ndarray, 
         flux: np.ndarray,
         min_period: float = 0.5,
-        max_period: float = 50.0
+        max_period: float = 50.0,
+        flux_stats: Optional[Dict] = None
     ) -> List[Dict]:
         """
         Detecta exoplanetas por método de trânsito
@@ -35,43 +264,38 @@ class CelestialBodyDetector:
             flux: Array de fluxo normalizado
             min_period: Período mínimo orbital (dias)
             max_period: Período máximo orbital (dias)
+            flux_stats: Estatísticas pré-calculadas do fluxo ('median', 'std')
             
         Returns:
             Lista de planetas detectados com parâmetros
         """
-        # Remover outliers manualmente (evitar problema com masked arrays)
-        flux_median = np.median(flux)
-        flux_std = np.std(flux)
-        mask = np.abs(flux - flux_median) < 5 * flux_std
-        
-        time_clean = time[mask]
-        flux_clean = flux[mask]
-        
-        # Normalizar fluxo
-        flux_norm = flux_clean / np.median(flux_clean)
+        # Remover outliers manualmente (evitar problema com masked arrays) e normalizar
+        flux_median, flux_std = self._flux_stats(flux, flux_stats)
+        time_clean, flux_norm = _clean_and_normalize(time, flux, flux_median, flux_std)
         
-        # Buscar períodos usando Lomb-Scargle
-        frequency = np.linspace(1/max_period, 1/min_period, 10000)
-        power = signal.lombscargle(time_clean, flux_norm - 1, frequency, normalize=True)
+        # Buscar períodos usando Lomb-Scargle (frequências em ciclos/dia)
+        frequency, power = _lomb_scargle(time_clean, flux_norm - 1,
+                                         self._frequency_grid(min_period, max_period),
+                                         backend=self.backend)
         
         # Encontrar picos
         peaks, properties = signal.find_peaks(power, height=0.1, distance=100)
         
+        # Top 5 candidatos por potência: seleção O(P) e ordenação só dos escolhidos
+        candidates = peaks
+        if len(peaks) > 5:
+            candidates = peaks[np.argpartition(power[peaks], -5)[-5:]]
+        candidates = candidates[np.argsort(-power[candidates], kind='stable')]
+        periods = 1 / frequency[candidates]
+        
+        # Profundidade e pontos em trânsito não dependem da ordem das fases, logo são
+        # iguais para todos os períodos: calcular uma vez e dobrar só o que varia
+        transit_depth = self._calculate_transit_depth(flux_norm)
+        in_transit = flux_norm < _quantiles(flux_norm, (0.25,))[0]
+        durations = _transit_duration_kernel(time_clean[in_transit], periods)
+        
         planets = []
-        for i, peak in enumerate(peaks[:5]):  # Top 5 candidatos
-            period = 1 / frequency[peak]
-            power_val = power[peak]
-            
-            # Dobrar curva de luz no período
-            phase = (time_clean % period) / period
-            sort_idx = np.argsort(phase)
-            phase_sorted = phase[sort_idx]
-            flux_sorted = flux_norm[sort_idx]
-            
-            # Detectar profundidade do trânsito
-            transit_depth = self._calculate_transit_depth(flux_sorted)
-            transit_duration = self._estimate_transit_duration(phase_sorted, flux_sorted)
-            
+        for period, transit_duration, power_val in zip(periods, durations, power[candidates]):
             if transit_depth > 0.001:  # Trânsito significativo (>0.1%)
                 planets.append({
                     'period_days': period,
@@ -83,11 +307,45 @@ class CelestialBodyDetector:
         
         return sorted(planets, key=lambda x: x['confidence'], reverse=True)
     
+    def detect_transiting_planets_batch(
+        self,
+        times: List[np.ndarray],
+        fluxes: List[np.ndarray],
+        min_period: float = 0.5,
+        max_period: float = 50.0,
+        max_workers: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """
+        Detecta exoplanetas em várias curvas de luz
+        
+        Na CPU cada curva vai para um processo (o periodograma é limitado por CPU e
+        não libera o GIL por inteiro); com backend='cuda' as curvas são processadas
+        em sequência, reaproveitando a grade de frequências já na GPU.
+        
+        Args:
+            times: Lista de arrays de tempo (tamanhos podem diferir)
+            fluxes: Lista de arrays de fluxo correspondentes
+            min_period: Período mínimo orbital (dias)
+            max_period: Período máximo orbital (dias)
+            max_workers: Número de processos (padrão: núcleos disponíveis)
+            
+        Returns:
+            Lista (uma por curva) de listas de planetas detectados
+        """
+        detect = partial(self.detect_transiting_planets, min_period=min_period, max_period=max_period)
+        
+        if self.backend == 'cuda' or len(times) < 2:
+            return [detect(time, flux) for time, flux in zip(times, fluxes)]
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(detect, times, fluxes))
+    
     def detect_comets(
         self,
         time: np.ndarray,
         flux: np.ndarray,
-        positions: Optional[np.ndarray] = None
+        positions: Optional[np.ndarray] = None,
+        flux_stats: Optional[Dict] = None
     ) -> List[Dict]:
         """
         Detecta cometas por variação de brilho não-periódica e movimento
@@ -96,6 +354,7 @@ class CelestialBodyDetector:
             time: Array de tempos
             flux: Array de fluxo
             positions: Array Nx2 de posições (RA, Dec) opcional
+            flux_stats: Estatísticas pré-calculadas do fluxo ('median', 'std')
             
         Returns:
             Lista de cometas detectados
@@ -103,50 +362,46 @@ class CelestialBodyDetector:
         comets = []
         
         # Normalizar fluxo
-        flux_norm = flux / np.median(flux)
+        flux_median = flux_stats['median'] if flux_stats else np.median(flux)
+        flux_norm = _as_float32(flux) / np.float32(flux_median)
         
         # Detectar tendência de aumento/diminuição de brilho (característica de cometas)
         # Cometas geralmente aumentam brilho ao se aproximar do Sol
+        # Média móvel por soma corrente (O(N)); bordas repetem o valor extremo em vez
+        # de zeros, que criavam uma rampa artificial no início da série
         window = min(len(flux) // 10, 50)
-        flux_smooth = np.convolve(flux_norm, np.ones(window)/window, mode='same')
-        
-        # Calcular taxa de mudança de brilho
-        brightness_change = np.diff(flux_smooth)
-        mean_change = np.mean(brightness_change)
-        std_change = np.std(brightness_change)
+        flux_smooth = uniform_filter1d(flux_norm, size=window, mode='nearest')
         
         # Detectar padrão de "outburst" típico de cometas
         # Aumento súbito seguido de decaimento gradual
-        for i in range(len(flux_smooth) - window):
-            segment = flux_smooth[i:i+window]
+        n_windows = len(flux_smooth) - window
+        if window > 10 and n_windows > 0:
+            # Amplitude (max - min) de cada metade de todas as janelas de uma vez,
+            # com filtros de máximo/mínimo alinhados ao início de cada metade
+            half = window // 2
+            rise = self._rolling_range(flux_smooth, half, 0, n_windows)
+            decay = self._rolling_range(flux_smooth, window - half, half, n_windows)
+            
+            # Cometa típico: rise rápido, decay lento
+            starts = np.flatnonzero((rise > 0.05) & (rise > decay * 1.5))
+            peak_idx = starts + sliding_window_view(flux_smooth, window)[starts].argmax(axis=1)
             
-            # Procurar padrão: aumento rápido + platô/decaimento lento
-            if len(segment) > 10:
-                first_half = segment[:len(segment)//2]
-                second_half = segment[len(segment)//2:]
+            for i, peak, rise_i in zip(starts.tolist(), peak_idx.tolist(), rise[starts].tolist()):
+                comet_data = {
+                    'detection_time': time[peak],
+                    'peak_brightness': flux_smooth[peak],
+                    'brightness_increase': rise_i,
+                    'activity_type': 'outburst',
+                    'confidence': min(rise_i / 0.1, 1.0)
+                }
                 
-                rise = np.max(first_half) - np.min(first_half)
-                decay = np.max(second_half) - np.min(second_half)
+                # Se temos dados de posição, calcular movimento
+                if positions is not None and len(positions) > i:
+                    velocity = self._calculate_velocity(positions, time, i, window)
+                    comet_data['velocity_deg_day'] = velocity
+                    comet_data['moving'] = velocity > 0.001
                 
-                # Cometa típico: rise rápido, decay lento
-                if rise > 0.05 and rise > decay * 1.5:
-                    peak_idx = i + np.argmax(segment)
-                    
-                    comet_data = {
-                        'detection_time': time[peak_idx],
-                        'peak_brightness': flux_smooth[peak_idx],
-                        'brightness_increase': rise,
-                        'activity_type': 'outburst',
-                        'confidence': min(rise / 0.1, 1.0)
-                    }
-                    
-                    # Se temos dados de posição, calcular movimento
-                    if positions is not None and len(positions) > i:
-                        velocity = self._calculate_velocity(positions, time, i, window)
-                        comet_data['velocity_deg_day'] = velocity
-                        comet_data['moving'] = velocity > 0.001
-                    
-                    comets.append(comet_data)
+                comets.append(comet_data)
         
         # Remover duplicatas (cometas detectados múltiplas vezes)
         if comets:
@@ -159,7 +414,9 @@ class CelestialBodyDetector:
         time: np.ndarray,
         flux: np.ndarray,
         min_duration_hours: float = 0.01,
-        max_duration_hours: float = 0.5
+        max_duration_hours: float = 0.5,
+        flux_stats: Optional[Dict] = None,
+        as_array: bool = False
     ) -> List[Dict]:
         """
         Detecta meteoros e eventos transientes ultra-rápidos
@@ -169,53 +426,37 @@ class CelestialBodyDetector:
             flux: Array de fluxo
             min_duration_hours: Duração mínima em horas
             max_duration_hours: Duração máxima em horas
+            flux_stats: Estatísticas pré-calculadas do fluxo ('median', 'std')
+            as_array: Retornar o array estruturado (METEOR_DTYPE) em vez de dicts
             
         Returns:
             Lista de meteoros/eventos rápidos detectados
         """
-        meteors = []
-        
-        flux_norm = flux / np.median(flux)
-        
-        # Calcular diferenças ponto-a-ponto
-        time_diff = np.diff(time) * 24  # Converter para horas
-        flux_diff = np.diff(flux_norm)
-        
-        # Detectar picos súbitos e curtos
-        threshold = self.sensitivity * np.std(flux_norm)
-        
-        i = 0
-        while i < len(flux_norm) - 2:
-            if flux_norm[i] > 1 + threshold:
-                # Encontrar duração do evento
-                event_start = i
-                event_end = i
-                
-                # Avançar enquanto o fluxo está elevado
-                while event_end < len(flux_norm) - 1 and flux_norm[event_end] > 1 + threshold/2:
-                    event_end += 1
-                
-                duration_hours = (time[event_end] - time[event_start]) * 24
-                
-                # Verificar se está na faixa de duração esperada
-                if min_duration_hours <= duration_hours <= max_duration_hours:
-                    peak_flux = np.max(flux_norm[event_start:event_end+1])
-                    peak_time = time[event_start + np.argmax(flux_norm[event_start:event_end+1])]
-                    
-                    meteors.append({
-                        'detection_time': peak_time,
-                        'peak_brightness': peak_flux,
-                        'duration_hours': duration_hours,
-                        'amplitude': peak_flux - 1.0,
-                        'event_type': 'meteor' if duration_hours < 0.1 else 'fast_transient',
-                        'confidence': min((peak_flux - 1.0) / threshold, 1.0)
-                    })
-                
-                i = event_end + 1
-            else:
-                i += 1
-        
-        return meteors
+        flux_median, flux_std = self._flux_stats(flux, flux_stats)
+        flux_norm = _as_float32(flux) / np.float32(flux_median)
+        
+        # Detectar picos súbitos e curtos (std(flux/m) == std(flux)/m)
+        threshold = self.sensitivity * flux_std / flux_median
+        
+        if njit is None:
+            # Sem Numba: listas Python indexam escalares bem mais rápido que arrays
+            flux_norm, time = flux_norm.tolist(), np.asarray(time).tolist()
+        peak_times, peak_fluxes, durations = _scan_transients(
+            flux_norm, time, threshold, min_duration_hours, max_duration_hours
+        )
+        
+        # Campos calculados coluna a coluna; dicts só na saída
+        meteors = np.empty(len(peak_times), dtype=METEOR_DTYPE)
+        meteors['detection_time'] = peak_times
+        meteors['peak_brightness'] = peak_fluxes
+        meteors['duration_hours'] = durations
+        meteors['amplitude'] = peak_fluxes - 1.0
+        meteors['event_type'] = np.where(durations < 0.1, 'meteor', 'fast_transient')
+        meteors['confidence'] = np.minimum((peak_fluxes - 1.0) / threshold, 1.0)
+        
+        if as_array:
+            return meteors
+        return [dict(zip(METEOR_DTYPE.names, values)) for values in meteors.tolist()]
 
     def detect_asteroids(
         self,
@@ -241,14 +482,14 @@ class CelestialBodyDetector:
         
         # Calcular velocidades
         velocities = np.diff(positions, axis=0) / np.diff(times)[:, np.newaxis]
-        speeds = np.linalg.norm(velocities, axis=1)
+        speeds = np.hypot(velocities[:, 0], velocities[:, 1])
         
         # Detectar objetos em movimento
         moving_mask = speeds > velocity_threshold
         
         if np.any(moving_mask):
             mean_velocity = np.mean(velocities[moving_mask], axis=0)
-            mean_speed = np.linalg.norm(mean_velocity)
+            mean_speed = math.hypot(mean_velocity[0], mean_velocity[1])
             
             # Estimar órbita
             orbit_params = self._estimate_orbit(positions, times, velocities)
@@ -292,46 +533,83 @@ class CelestialBodyDetector:
         # Detectar aumentos súbitos de brilho
         threshold = self.sensitivity * np.std(delta_mag)
         
+        # Histerese: evento começa abaixo de -threshold e termina no primeiro ponto
+        # acima de -threshold/2 (ou no último ponto). Os índices candidatos saem de
+        # máscaras vetorizadas; o encadeamento percorre eventos, não amostras.
+        starts_candidates = np.flatnonzero(delta_mag < -threshold)
+        ends_candidates = np.flatnonzero(delta_mag > -threshold/2)
+        last = len(time) - 1
+        
         transients = []
-        in_event = False
-        event_start = None
-        
-        for i in range(len(time)):
-            if delta_mag[i] < -threshold and not in_event:  # Magnitude menor = mais brilhante
-                in_event = True
-                event_start = i
-            elif (delta_mag[i] > -threshold/2 or i == len(time)-1) and in_event:
-                in_event = False
-                event_end = i
-                
-                # Caracterizar evento
-                event_mags = magnitude[event_start:event_end+1]
-                event_times = time[event_start:event_end+1]
-                
-                peak_mag = np.min(event_mags)
-                peak_time = event_times[np.argmin(event_mags)]
-                duration = event_times[-1] - event_times[0]
-                
-                # Classificar tipo de evento
-                event_type = self._classify_transient(
-                    peak_mag - reference_mag,
-                    duration
-                )
-                
-                transients.append({
-                    'start_time': event_times[0],
-                    'peak_time': peak_time,
-                    'end_time': event_times[-1],
-                    'duration_days': duration,
-                    'peak_magnitude': peak_mag,
-                    'amplitude': reference_mag - peak_mag,
-                    'type': event_type,
-                    'rise_time': peak_time - event_times[0],
-                    'decay_time': event_times[-1] - peak_time
-                })
+        k = 0
+        while k < len(starts_candidates):
+            event_start = starts_candidates[k]
+            j = np.searchsorted(ends_candidates, event_start, side='right')
+            if j < len(ends_candidates):
+                event_end = ends_candidates[j]
+            elif event_start < last:
+                event_end = last
+            else:
+                break  # Evento iniciado no último ponto nunca é fechado
+            
+            # Caracterizar evento
+            event_mags = magnitude[event_start:event_end+1]
+            event_times = time[event_start:event_end+1]
+            
+            peak_idx = np.argmin(event_mags)
+            peak_mag = event_mags[peak_idx]
+            peak_time = event_times[peak_idx]
+            duration = event_times[-1] - event_times[0]
+            
+            # Classificar tipo de evento
+            event_type = self._classify_transient(
+                peak_mag - reference_mag,
+                duration
+            )
+            
+            transients.append({
+                'start_time': event_times[0],
+                'peak_time': peak_time,
+                'end_time': event_times[-1],
+                'duration_days': duration,
+                'peak_magnitude': peak_mag,
+                'amplitude': reference_mag - peak_mag,
+                'type': event_type,
+                'rise_time': peak_time - event_times[0],
+                'decay_time': event_times[-1] - peak_time
+            })
+            
+            # Próximo evento só pode começar depois do fim deste
+            k = np.searchsorted(starts_candidates, event_end, side='right')
         
         return transients
     
+    def _frequency_grid(self, min_period: float, max_period: float, n_freq: int = 10000) -> np.ndarray:
+        """Grade regular de frequências (ciclos/dia) do periodograma, criada uma vez por configuração"""
+        key = (min_period, max_period, n_freq)
+        frequency = self._ls_plan.get(key)
+        if frequency is None:
+            frequency = np.linspace(1/max_period, 1/min_period, n_freq)
+            frequency.setflags(write=False)  # Compartilhada entre chamadas
+            self._ls_plan[key] = frequency
+        return frequency
+    
+    def _flux_stats(self, flux: np.ndarray, flux_stats: Optional[Dict] = None) -> Tuple[float, float]:
+        """Retorna (mediana, desvio padrão) do fluxo, reaproveitando valores já calculados"""
+        if flux_stats:
+            return flux_stats['median'], flux_stats['std']
+        if njit is not None:
+            median, std = _median_std_kernel(np.ascontiguousarray(flux, dtype=np.float64))
+            return float(median), float(std)
+        return np.median(flux), np.std(flux)
+    
+    def _rolling_range(self, values: np.ndarray, size: int, offset: int, count: int) -> np.ndarray:
+        """max - min de values[i+offset : i+offset+size] para i em range(count)"""
+        origin = -(size // 2)  # Janela começando no próprio índice
+        rolling_max = maximum_filter1d(values, size, origin=origin)
+        rolling_min = minimum_filter1d(values, size, origin=origin)
+        return (rolling_max - rolling_min)[offset:offset + count]
+    
     def _calculate_velocity(self, positions, times, start_idx, window):
         """Calcula velocidade média em uma janela"""
         end_idx = min(start_idx + window, len(positions))
@@ -341,9 +619,15 @@ class CelestialBodyDetector:
         pos_segment = positions[start_idx:end_idx]
         time_segment = times[start_idx:end_idx]
         
-        # Regressão linear para posição vs tempo
-        velocities = np.diff(pos_segment, axis=0) / np.diff(time_segment)[:, np.newaxis]
-        return np.linalg.norm(np.mean(velocities, axis=0))
+        # Com passo constante, a média das velocidades de cada passo se reduz
+        # a (último - primeiro) / intervalo total, sem diferenças par a par
+        dts = np.diff(time_segment)
+        if np.ptp(dts) <= 1e-9 * abs(dts[0]):
+            mean_velocity = (pos_segment[-1] - pos_segment[0]) / (time_segment[-1] - time_segment[0])
+        else:
+            velocities = np.diff(pos_segment, axis=0) / dts[:, np.newaxis]
+            mean_velocity = np.mean(velocities, axis=0)
+        return math.hypot(mean_velocity[0], mean_velocity[1])
     
     def _remove_duplicate_detections(self, detections, time_threshold=5.0):
         """Remove detecções duplicadas próximas no tempo"""
@@ -352,29 +636,25 @@ class CelestialBodyDetector:
         
         # Ordenar por tempo
         sorted_det = sorted(detections, key=lambda x: x['detection_time'])
+        times = np.fromiter((d['detection_time'] for d in sorted_det), dtype=np.float64,
+                            count=len(sorted_det))
         
-        unique = [sorted_det[0]]
-        for det in sorted_det[1:]:
-            if det['detection_time'] - unique[-1]['detection_time'] > time_threshold:
-                unique.append(det)
+        # A distância conta a partir da última detecção mantida (não da anterior),
+        # então cada salto vai direto à primeira detecção além do limiar
+        unique = []
+        i = 0
+        while i < len(sorted_det):
+            unique.append(sorted_det[i])
+            i = max(i + 1, int(np.searchsorted(times, times[i] + time_threshold, side='right')))
         
         return unique
 
     def _calculate_transit_depth(self, flux_folded: np.ndarray) -> float:
         """Calcula profundidade do trânsito"""
-        baseline = np.percentile(flux_folded, 90)  # Fora do trânsito
-        transit = np.percentile(flux_folded, 10)   # Durante o trânsito
+        # 90% fora do trânsito, 10% durante o trânsito (uma só partição)
+        transit, baseline = _quantiles(flux_folded, (0.10, 0.90))
         return (baseline - transit) / baseline
     
-    def _estimate_transit_duration(self, phase: np.ndarray, flux: np.ndarray) -> float:
-        """Estima duração do trânsito como fração do período"""
-        threshold = np.percentile(flux, 25)
-        in_transit = flux < threshold
-        if np.any(in_transit):
-            transit_phases = phase[in_transit]
-            return np.ptp(transit_phases)  # Range de fases
-        return 0.0
-    
     def _calculate_confidence(self, power: float, depth: float) -> float:
         """Calcula confiança da detecção"""
         # Combinar poder do sinal e profundidade do trânsito
@@ -389,7 +669,7 @@ class CelestialBodyDetector:
     ) -> Dict:
         """Estima parâmetros orbitais aproximados"""
         # Análise simplificada de órbita
-        mean_speed = np.mean(np.linalg.norm(velocities, axis=1))
+        mean_speed = np.mean(np.hypot(velocities[:, 0], velocities[:, 1]))
         
         # Classificar tipo orbital baseado em velocidade
         if mean_speed > 1.0:  # graus/dia
@@ -426,38 +706,38 @@ class CelestialBodyDetector:
     
     def generate_report(self, detections: Dict) -> str:
         """Gera relatório de detecções"""
-        report = "="*60 + "\n"
-        report += "RELATÓRIO DE DETECÇÃO DE CORPOS CELESTES\n"
-        report += "="*60 + "\n\n"
+        parts = ["="*60 + "\n"]
+        parts.append("RELATÓRIO DE DETECÇÃO DE CORPOS CELESTES\n")
+        parts.append("="*60 + "\n\n")
         
         if 'planets' in detections and detections['planets']:
-            report += f"🪐 EXOPLANETAS DETECTADOS: {len(detections['planets'])}\n"
-            report += "-"*60 + "\n"
+            parts.append(f"🪐 EXOPLANETAS DETECTADOS: {len(detections['planets'])}\n")
+            parts.append("-"*60 + "\n")
             for i, planet in enumerate(detections['planets'], 1):
-                report += f"\nPlaneta Candidato #{i}:\n"
-                report += f"  Período Orbital: {planet['period_days']:.2f} dias\n"
-                report += f"  Profundidade Trânsito: {planet['transit_depth']*100:.3f}%\n"
-                report += f"  Duração Trânsito: {planet['transit_duration_hours']:.2f} horas\n"
-                report += f"  Confiança: {planet['confidence']:.1f}%\n"
+                parts.append(f"\nPlaneta Candidato #{i}:\n")
+                parts.append(f"  Período Orbital: {planet['period_days']:.2f} dias\n")
+                parts.append(f"  Profundidade Trânsito: {planet['transit_depth']*100:.3f}%\n")
+                parts.append(f"  Duração Trânsito: {planet['transit_duration_hours']:.2f} horas\n")
+                parts.append(f"  Confiança: {planet['confidence']:.1f}%\n")
         
         if 'asteroids' in detections and detections['asteroids']:
-            report += f"\n☄️ ASTEROIDES DETECTADOS: {len(detections['asteroids'])}\n"
-            report += "-"*60 + "\n"
+            parts.append(f"\n☄️ ASTEROIDES DETECTADOS: {len(detections['asteroids'])}\n")
+            parts.append("-"*60 + "\n")
             for i, asteroid in enumerate(detections['asteroids'], 1):
-                report += f"\nAsteroide #{i}:\n"
-                report += f"  Velocidade: {asteroid['mean_velocity_deg_day']:.4f} graus/dia\n"
-                report += f"  Tipo Orbital: {asteroid['orbit_type']}\n"
-                report += f"  Excentricidade: {asteroid['eccentricity']:.2f}\n"
+                parts.append(f"\nAsteroide #{i}:\n")
+                parts.append(f"  Velocidade: {asteroid['mean_velocity_deg_day']:.4f} graus/dia\n")
+                parts.append(f"  Tipo Orbital: {asteroid['orbit_type']}\n")
+                parts.append(f"  Excentricidade: {asteroid['eccentricity']:.2f}\n")
         
         if 'transients' in detections and detections['transients']:
-            report += f"\n💥 EVENTOS TRANSIENTES: {len(detections['transients'])}\n"
-            report += "-"*60 + "\n"
+            parts.append(f"\n💥 EVENTOS TRANSIENTES: {len(detections['transients'])}\n")
+            parts.append("-"*60 + "\n")
             for i, event in enumerate(detections['transients'], 1):
-                report += f"\nEvento #{i}:\n"
-                report += f"  Tipo: {event['type']}\n"
-                report += f"  Amplitude: {event['amplitude']:.2f} mag\n"
-                report += f"  Duração: {event['duration_days']:.2f} dias\n"
-                report += f"  Magnitude Pico: {event['peak_magnitude']:.2f}\n"
-        
-        report += "\n" + "="*60 + "\n"
-        return report
+                parts.append(f"\nEvento #{i}:\n")
+                parts.append(f"  Tipo: {event['type']}\n")
+                parts.append(f"  Amplitude: {event['amplitude']:.2f} mag\n")
+                parts.append(f"  Duração: {event['duration_days']:.2f} dias\n")
+                parts.append(f"  Magnitude Pico: {event['peak_magnitude']:.2f}\n")
+        
+        parts.append("\n" + "="*60 + "\n")
+        return ''.join(parts)
@@ -8,7 +8,7 @@ from stellar_seismology import StellarSeismologyAnalyzer
 from pattern_detector import PatternDetector
 from visualizer import CosmicVisualizer
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 class CosmicAnalyzer:
@@ -54,20 +54,26 @@ class CosmicAnalyzer:
         print("🌌 Iniciando análise de curva de luz...")
         print("="*70)
         
+        # Mediana e desvio padrão calculados uma vez e repassados a cada detector
+        flux_stats = {'median': float(np.median(flux)), 'std': float(np.std(flux))}
+        
         # Detecção de planetas
         if detect_planets:
             print("\n🔭 Detectando exoplanetas...")
             results['planets'] = self.celestial_detector.detect_transiting_planets(
-                time, flux
+                time, flux, flux_stats=flux_stats
             )
             print(f"   ✓ {len(results['planets'])} planetas candidatos encontrados")
         
         # Detecção de transientes
         if detect_transients:
             print("\n💥 Detectando eventos transientes...")
-            magnitude = -2.5 * np.log10(flux)
+            # log10 e escala no mesmo buffer (sem array temporário para o -2.5 *)
+            magnitude = np.log10(flux)
+            magnitude *= -2.5
+            # Magnitude é monotônica no fluxo: a mediana vem da mediana do fluxo
             results['transients'] = self.celestial_detector.detect_transient_events(
-                time, magnitude
+                time, magnitude, reference_mag=-2.5 * np.log10(flux_stats['median'])
             )
             print(f"   ✓ {len(results['transients'])} eventos encontrados")
         
@@ -75,7 +81,7 @@ class CosmicAnalyzer:
         if analyze_vibrations:
             print("\n⭐ Analisando vibrações estelares...")
             results['seismology'] = self.seismo_analyzer.analyze_stellar_vibrations(
-                time, flux
+                time, flux, flux_stats=flux_stats
             )
             params = results['seismology']['stellar_parameters']
             print(f"   ✓ Massa: {params['mass_solar']:.2f} M☉")
@@ -115,6 +121,31 @@ class CosmicAnalyzer:
         
         return results
     
+    def analyze_lightcurve_batch(
+        self,
+        times: List[np.ndarray],
+        fluxes: List[np.ndarray],
+        max_workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Busca de planetas em trânsito em muitas curvas de luz (levantamentos)
+        
+        Args:
+            times: Lista de arrays de tempo
+            fluxes: Lista de arrays de fluxo
+            max_workers: Número de processos para a busca na CPU
+            
+        Returns:
+            Lista de dicionários {'planets': [...]}, um por curva de luz
+        """
+        print(f"🔭 Detectando exoplanetas em {len(times)} curvas de luz...")
+        planets = self.celestial_detector.detect_transiting_planets_batch(
+            times, fluxes, max_workers=max_workers
+        )
+        print(f"   ✓ {sum(map(len, planets))} planetas candidatos encontrados")
+        
+        return [{'planets': found} for found in planets]
+    
     def analyze_signal(
         self,
         signal_data: np.ndarray,
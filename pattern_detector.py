@@ -453,48 +453,48 @@ class PatternDetector:
     
     def generate_pattern_report(self, analysis: Dict) -> str:
         """Gera relatório de análise de padrões"""
-        report = "="*70 + "\n"
-        report += "RELATÓRIO DE ANÁLISE DE PADRÕES E SINAIS\n"
-        report += "="*70 + "\n\n"
+        parts = ["="*70 + "\n"]
+        parts.append("RELATÓRIO DE ANÁLISE DE PADRÕES E SINAIS\n")
+        parts.append("="*70 + "\n\n")
         
         score = analysis['artificiality_score']
-        report += f"🎯 SCORE DE ARTIFICIALIDADE: {score['score']}/100\n"
-        report += f"📊 CLASSIFICAÇÃO: {score['classification']}\n\n"
+        parts.append(f"🎯 SCORE DE ARTIFICIALIDADE: {score['score']}/100\n")
+        parts.append(f"📊 CLASSIFICAÇÃO: {score['classification']}\n\n")
         
         if score['reasons']:
-            report += "🔍 EVIDÊNCIAS ENCONTRADAS:\n"
+            parts.append("🔍 EVIDÊNCIAS ENCONTRADAS:\n")
             for reason in score['reasons']:
-                report += f"  • {reason}\n"
-            report += "\n"
+                parts.append(f"  • {reason}\n")
+            parts.append("\n")
         
-        report += "📈 ANÁLISE DE ALEATORIEDADE:\n"
-        report += "-"*70 + "\n"
+        parts.append("📈 ANÁLISE DE ALEATORIEDADE:\n")
+        parts.append("-"*70 + "\n")
         if 'runs_test' in analysis['randomness']:
             rt = analysis['randomness']['runs_test']
-            report += f"  Teste de Runs: {'ALEATÓRIO' if rt['is_random'] else 'NÃO-ALEATÓRIO'}\n"
-            report += f"    p-value: {rt['p_value']:.4f}\n"
-        report += "\n"
+            parts.append(f"  Teste de Runs: {'ALEATÓRIO' if rt['is_random'] else 'NÃO-ALEATÓRIO'}\n")
+            parts.append(f"    p-value: {rt['p_value']:.4f}\n")
+        parts.append("\n")
         
-        report += "🔄 PERIODICIDADE:\n"
-        report += "-"*70 + "\n"
-        report += f"  Períodos significativos: {analysis['periodicity']['n_significant_periods']}\n"
+        parts.append("🔄 PERIODICIDADE:\n")
+        parts.append("-"*70 + "\n")
+        parts.append(f"  Períodos significativos: {analysis['periodicity']['n_significant_periods']}\n")
         for i, p in enumerate(analysis['periodicity']['periodicities'][:5], 1):
-            report += f"    {i}. Frequência: {p['frequency_Hz']:.4f} Hz "
-            report += f"(Período: {p['period_seconds']:.2f}s, σ={p['significance_sigma']:.1f})\n"
-        report += "\n"
+            parts.append(f"    {i}. Frequência: {p['frequency_Hz']:.4f} Hz ")
+            parts.append(f"(Período: {p['period_seconds']:.2f}s, σ={p['significance_sigma']:.1f})\n")
+        parts.append("\n")
         
-        report += "📊 ENTROPIA:\n"
-        report += "-"*70 + "\n"
+        parts.append("📊 ENTROPIA:\n")
+        parts.append("-"*70 + "\n")
         ent = analysis['entropy']
-        report += f"  Entropia normalizada: {ent['normalized_entropy']:.3f}\n"
-        report += f"  Interpretação: {ent['interpretation']}\n\n"
+        parts.append(f"  Entropia normalizada: {ent['normalized_entropy']:.3f}\n")
+        parts.append(f"  Interpretação: {ent['interpretation']}\n\n")
         
         if analysis['pulses'].get('is_regular'):
-            report += "⚡ PULSOS REGULARES DETECTADOS:\n"
-            report += "-"*70 + "\n"
-            report += f"  Número de pulsos: {analysis['pulses']['n_pulses']}\n"
-            report += f"  Intervalo médio: {analysis['pulses']['mean_interval']:.2f}\n"
-            report += f"  Regularidade: {analysis['pulses']['interval_regularity']*100:.1f}%\n\n"
-        
-        report += "="*70 + "\n"
-        return report
+            parts.append("⚡ PULSOS REGULARES DETECTADOS:\n")
+            parts.append("-"*70 + "\n")
+            parts.append(f"  Número de pulsos: {analysis['pulses']['n_pulses']}\n")
+            parts.append(f"  Intervalo médio: {analysis['pulses']['mean_interval']:.2f}\n")
+            parts.append(f"  Regularidade: {analysis['pulses']['interval_regularity']*100:.1f}%\n\n")
+        
+        parts.append("="*70 + "\n")
+        return ''.join(parts)
@@ -379,25 +379,25 @@ class SimbadChecker:
         total = resultado_simbad.get('total_objetos', 0)
         url = resultado_simbad.get('url_busca', '')
         
-        relatorio = f"### Verificação SIMBAD\n\n"
-        relatorio += f"**Status:** {status}\n\n"
-        relatorio += f"**Objetos encontrados:** {total}\n\n"
+        partes = ["### Verificação SIMBAD\n\n"]
+        partes.append(f"**Status:** {status}\n\n")
+        partes.append(f"**Objetos encontrados:** {total}\n\n")
         
         if total > 0:
             obj_principal = resultado_simbad.get('objeto_principal')
             if obj_principal:
-                relatorio += f"**Objeto mais próximo:**\n"
-                relatorio += f"- Nome: {obj_principal.get('identificador', 'N/A')}\n"
-                relatorio += f"- Tipo: {obj_principal.get('tipo', 'N/A')}\n"
-                relatorio += f"- Distância: {obj_principal.get('distancia_arcsec', 0):.2f} arcsec\n"
-                relatorio += f"- Referências: {obj_principal.get('referencias', 0)}\n\n"
+                partes.append("**Objeto mais próximo:**\n")
+                partes.append(f"- Nome: {obj_principal.get('identificador', 'N/A')}\n")
+                partes.append(f"- Tipo: {obj_principal.get('tipo', 'N/A')}\n")
+                partes.append(f"- Distância: {obj_principal.get('distancia_arcsec', 0):.2f} arcsec\n")
+                partes.append(f"- Referências: {obj_principal.get('referencias', 0)}\n\n")
             
             if total > 1:
-                relatorio += f"**Outros {total - 1} objetos encontrados no campo**\n\n"
+                partes.append(f"**Outros {total - 1} objetos encontrados no campo**\n\n")
         
-        relatorio += f"[🔗 Ver detalhes completos no SIMBAD]({url})\n"
+        partes.append(f"[🔗 Ver detalhes completos no SIMBAD]({url})\n")
         
-        return relatorio
+        return ''.join(partes)
 
 
 # Função auxiliar para uso rápido
@@ -5,8 +5,7 @@ Transforma ondulações estelares e variações de brilho em som
 
 import numpy as np
 import io
-import wave
-from scipy.io import wavfile
+import soundfile as sf
 from scipy import signal
 
 class SonificadorEstelar:
@@ -47,25 +46,20 @@ class SonificadorEstelar:
         # Mapear fluxo para frequências
         frequencies = freq_min + (freq_max - freq_min) * flux_interp
         
-        # Gerar áudio
-        t = np.arange(n_samples) / self.sample_rate
-        audio = np.zeros(n_samples)
-        
-        # Síntese de frequência modulada
-        phase = 0
-        for i in range(n_samples):
-            audio[i] = np.sin(2 * np.pi * phase)
-            phase += frequencies[i] / self.sample_rate
-            if phase > 1:
-                phase -= 1
+        # Síntese de frequência modulada: a fase é a soma acumulada das
+        # frequências instantâneas (fase da amostra i usa as frequências até i-1)
+        phase = np.empty(n_samples)
+        phase[0] = 0.0
+        np.cumsum(frequencies[:-1] / self.sample_rate, out=phase[1:])
+        audio = np.sin(2 * np.pi * phase).astype(np.float32)
         
         # Aplicar envelope para suavizar início e fim
-        envelope = np.ones(n_samples)
+        envelope = np.ones(n_samples, dtype=np.float32)
         fade_samples = int(0.1 * n_samples)  # 10% fade
         envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
         envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
         
-        audio = audio * envelope * 0.5  # Volume 50%
+        audio *= envelope * 0.5  # Volume 50%
         
         return audio, self.sample_rate
     
@@ -188,13 +182,12 @@ class SonificadorEstelar:
         Returns:
             bytes: Dados WAV
         """
-        # Converter para int16
-        audio_int16 = np.int16(audio_data * 32767)
+        # float32 basta para o áudio; o soundfile converte para PCM 16 bits na escrita
+        audio = np.asarray(audio_data, dtype=np.float32)
         
         # Criar buffer
         buffer = io.BytesIO()
-        wavfile.write(buffer, sample_rate, audio_int16)
-        buffer.seek(0)
+        sf.write(buffer, audio, sample_rate, subtype='PCM_16', format='WAV')
         
         return buffer.getvalue()
     
@@ -5,6 +5,7 @@ Analisa oscilações e frequências de pulsação em estrelas
 
 import numpy as np
 from scipy import signal, fft
+from scipy.ndimage import uniform_filter1d
 from scipy.optimize import curve_fit
 from scipy.stats import gaussian_kde
 import pandas as pd
@@ -17,12 +18,14 @@ class StellarSeismologyAnalyzer:
     def __init__(self):
         self.solar_nu_max = 3090.0  # μHz (frequência de potência máxima do Sol)
         self.solar_delta_nu = 135.1  # μHz (grande separação do Sol)
+        self.max_modes = 50  # Modos mais proeminentes mantidos por análise
         
     def analyze_stellar_vibrations(
         self,
         time: np.ndarray,
         flux: np.ndarray,
-        cadence: float = 30.0  # minutos
+        cadence: float = 30.0,  # minutos
+        flux_stats: Optional[Dict] = None
     ) -> Dict:
         """
         Análise completa de vibrações estelares
@@ -31,12 +34,13 @@ class StellarSeismologyAnalyzer:
             time: Array de tempos (dias)
             flux: Array de fluxo normalizado
             cadence: Cadência de observação em minutos
+            flux_stats: Estatísticas pré-calculadas do fluxo ('median', 'std')
             
         Returns:
             Dicionário com análise completa de asterosismologia
         """
         # 1. Preparar dados
-        flux_prep = self._prepare_lightcurve(time, flux)
+        flux_prep = self._prepare_lightcurve(time, flux, flux_stats)
         
         # 2. Calcular espectro de potência
         frequencies, power = self._calculate_power_spectrum(time, flux_prep, cadence)
@@ -73,11 +77,19 @@ class StellarSeismologyAnalyzer:
             'quality_metrics': self._calculate_quality_metrics(power, modes)
         }
     
-    def _prepare_lightcurve(self, time: np.ndarray, flux: np.ndarray) -> np.ndarray:
+    def _prepare_lightcurve(
+        self,
+        time: np.ndarray,
+        flux: np.ndarray,
+        flux_stats: Optional[Dict] = None
+    ) -> np.ndarray:
         """Prepara curva de luz removendo tendências e normalizando"""
         # Remover outliers
-        flux_median = np.median(flux)
-        flux_std = np.std(flux)
+        if flux_stats:
+            flux_median, flux_std = flux_stats['median'], flux_stats['std']
+        else:
+            flux_median = np.median(flux)
+            flux_std = np.std(flux)
         mask = np.abs(flux - flux_median) < 5 * flux_std
         
         flux_clean = flux.copy()
@@ -108,19 +120,15 @@ class StellarSeismologyAnalyzer:
         time_regular = np.arange(time[0], time[-1], dt)
         flux_regular = np.interp(time_regular, time, flux)
         
-        # Calcular FFT
-        fft_flux = fft.fft(flux_regular)
-        power = np.abs(fft_flux) ** 2
-        
-        # Frequências em microHertz
+        # Calcular FFT real: o sinal é real, então só metade do espectro é necessária
         n = len(flux_regular)
-        freq_hz = fft.fftfreq(n, dt * 86400)  # Converter dias para segundos
-        freq_uHz = freq_hz * 1e6
+        fft_flux = fft.rfft(flux_regular, workers=-1)
+        freq_hz = fft.rfftfreq(n, dt * 86400)  # Converter dias para segundos
         
-        # Apenas frequências positivas
-        positive_mask = freq_uHz > 0
-        frequencies = freq_uHz[positive_mask]
-        power = power[positive_mask]
+        # Apenas frequências positivas (sem DC nem Nyquist, como a máscara fftfreq > 0)
+        positive = slice(1, (n - 1) // 2 + 1)
+        frequencies = freq_hz[positive] * 1e6  # microHertz
+        power = np.abs(fft_flux[positive]) ** 2
         
         # Suavizar espectro
         power_smooth = self._smooth_power_spectrum(frequencies, power)
@@ -133,9 +141,9 @@ class StellarSeismologyAnalyzer:
         power: np.ndarray,
         box_size: int = 10
     ) -> np.ndarray:
-        """Suaviza espectro de potência"""
-        kernel = np.ones(box_size) / box_size
-        power_smooth = np.convolve(power, kernel, mode='same')
+        """Suaviza espectro de potência (média móvel por soma corrente, O(N) para qualquer box_size)"""
+        # mode='constant' reproduz o preenchimento com zeros do np.convolve(mode='same')
+        power_smooth = uniform_filter1d(power, size=box_size, mode='constant')
         return power_smooth
     
     def _find_nu_max(self, frequencies: np.ndarray, power: np.ndarray) -> float:
@@ -221,44 +229,48 @@ class StellarSeismologyAnalyzer:
         freq_region = frequencies[mask]
         power_region = power[mask]
         
-        # Encontrar picos
+        # Encontrar picos (prominence=0 só pede o cálculo das proeminências)
         threshold = np.percentile(power_region, 75)
         peaks, properties = signal.find_peaks(
             power_region,
             height=threshold,
-            distance=max(1, int(delta_nu / np.mean(np.diff(freq_region)) / 3))
+            distance=max(1, int(delta_nu / np.mean(np.diff(freq_region)) / 3)),
+            prominence=0
         )
         
-        modes = []
-        for peak in peaks:
-            freq = freq_region[peak]
-            amplitude = power_region[peak]
-            
-            # Classificar modo (l=0, 1, 2, 3...)
-            # l=0 são os modos radiais principais
-            mode_order = int(round((freq - nu_max) / delta_nu))
-            
-            # Estimar grau do modo
-            offset = (freq - (nu_max + mode_order * delta_nu)) / delta_nu
-            
-            if abs(offset) < 0.15:
-                degree = 0  # Modo radial
-            elif abs(offset - 0.5) < 0.15:
-                degree = 1  # Modo dipolar
-            elif abs(offset + 0.5) < 0.15:
-                degree = 1  # Modo dipolar
-            else:
-                degree = 2  # Modo quadrupolar
-            
-            modes.append({
+        # Manter os modos mais proeminentes, do mais forte para o mais fraco
+        order = np.argsort(properties['prominences'])[::-1][:self.max_modes]
+        freqs = freq_region[peaks[order]]
+        amplitudes = power_region[peaks[order]]
+        
+        # Classificar modo (l=0, 1, 2, 3...)
+        # l=0 são os modos radiais principais
+        mode_orders = np.rint((freqs - nu_max) / delta_nu).astype(int)
+        
+        # Estimar grau do modo
+        offsets = (freqs - (nu_max + mode_orders * delta_nu)) / delta_nu
+        degrees = np.select(
+            [
+                np.abs(offsets) < 0.15,        # Modo radial
+                np.abs(offsets - 0.5) < 0.15,  # Modo dipolar
+                np.abs(offsets + 0.5) < 0.15   # Modo dipolar
+            ],
+            [0, 1, 1],
+            default=2                          # Modo quadrupolar
+        )
+        
+        return [
+            {
                 'frequency_uHz': freq,
                 'amplitude': amplitude,
                 'mode_order': mode_order,
                 'degree': degree,
                 'type': self._classify_mode(degree)
-            })
-        
-        return modes
+            }
+            for freq, amplitude, mode_order, degree in zip(
+                freqs, amplitudes, mode_orders.tolist(), degrees.tolist()
+            )
+        ]
     
     def _estimate_stellar_parameters(
         self,
@@ -345,13 +357,10 @@ class StellarSeismologyAnalyzer:
         # Rotação causa divisão dos modos l=1
         mode_freqs = np.array([m['frequency_uHz'] for m in modes])
         
-        # Calcular diferenças entre modos próximos
-        diffs = []
-        for i in range(len(mode_freqs)-1):
-            for j in range(i+1, len(mode_freqs)):
-                diff = abs(mode_freqs[j] - mode_freqs[i])
-                if 0.1 < diff < 2.0:  # Range típico de divisão rotacional
-                    diffs.append(diff)
+        # Calcular diferenças entre todos os pares de modos
+        i, j = np.triu_indices(len(mode_freqs), k=1)
+        diffs = np.abs(mode_freqs[j] - mode_freqs[i])
+        diffs = diffs[(diffs > 0.1) & (diffs < 2.0)]  # Range típico de divisão rotacional
         
         if len(diffs) > 0:
             # Divisão rotacional típica
@@ -417,45 +426,45 @@ class StellarSeismologyAnalyzer:
     
     def generate_seismology_report(self, analysis: Dict) -> str:
         """Gera relatório detalhado de asterosismologia"""
-        report = "="*70 + "\n"
-        report += "RELATÓRIO DE ASTEROSISMOLOGIA - ANÁLISE DE VIBRAÇÕES ESTELARES\n"
-        report += "="*70 + "\n\n"
+        parts = ["="*70 + "\n"]
+        parts.append("RELATÓRIO DE ASTEROSISMOLOGIA - ANÁLISE DE VIBRAÇÕES ESTELARES\n")
+        parts.append("="*70 + "\n\n")
         
-        report += "📊 FREQUÊNCIAS DE OSCILAÇÃO:\n"
-        report += "-"*70 + "\n"
-        report += f"  ν_max (freq. potência máxima): {analysis['nu_max_uHz']:.2f} μHz\n"
-        report += f"  Δν (grande separação):         {analysis['delta_nu_uHz']:.2f} μHz\n"
-        report += f"  Largura do envelope:           {analysis['envelope_width_uHz']:.2f} μHz\n\n"
+        parts.append("📊 FREQUÊNCIAS DE OSCILAÇÃO:\n")
+        parts.append("-"*70 + "\n")
+        parts.append(f"  ν_max (freq. potência máxima): {analysis['nu_max_uHz']:.2f} μHz\n")
+        parts.append(f"  Δν (grande separação):         {analysis['delta_nu_uHz']:.2f} μHz\n")
+        parts.append(f"  Largura do envelope:           {analysis['envelope_width_uHz']:.2f} μHz\n\n")
         
         params = analysis['stellar_parameters']
-        report += "⭐ PARÂMETROS ESTELARES DERIVADOS:\n"
-        report += "-"*70 + "\n"
-        report += f"  Massa:                {params['mass_solar']:.2f} M☉\n"
-        report += f"  Raio:                 {params['radius_solar']:.2f} R☉\n"
-        report += f"  log g:                {params['log_g']:.2f}\n"
-        report += f"  Densidade:            {params['density_solar']:.2f} ρ☉\n"
-        report += f"  Temperatura efetiva:  {params['teff_K']} K\n"
-        report += f"  Idade estimada:       {params['age_gyr']:.2f} Gyr\n"
-        report += f"  Estágio evolutivo:    {params['evolutionary_stage']}\n\n"
-        
-        report += f"🎵 MODOS DE OSCILAÇÃO DETECTADOS: {len(analysis['oscillation_modes'])}\n"
-        report += "-"*70 + "\n"
+        parts.append("⭐ PARÂMETROS ESTELARES DERIVADOS:\n")
+        parts.append("-"*70 + "\n")
+        parts.append(f"  Massa:                {params['mass_solar']:.2f} M☉\n")
+        parts.append(f"  Raio:                 {params['radius_solar']:.2f} R☉\n")
+        parts.append(f"  log g:                {params['log_g']:.2f}\n")
+        parts.append(f"  Densidade:            {params['density_solar']:.2f} ρ☉\n")
+        parts.append(f"  Temperatura efetiva:  {params['teff_K']} K\n")
+        parts.append(f"  Idade estimada:       {params['age_gyr']:.2f} Gyr\n")
+        parts.append(f"  Estágio evolutivo:    {params['evolutionary_stage']}\n\n")
+        
+        parts.append(f"🎵 MODOS DE OSCILAÇÃO DETECTADOS: {len(analysis['oscillation_modes'])}\n")
+        parts.append("-"*70 + "\n")
         for i, mode in enumerate(analysis['oscillation_modes'][:10], 1):
-            report += f"  Modo {i}: {mode['frequency_uHz']:.2f} μHz - {mode['type']}\n"
+            parts.append(f"  Modo {i}: {mode['frequency_uHz']:.2f} μHz - {mode['type']}\n")
         if len(analysis['oscillation_modes']) > 10:
-            report += f"  ... e mais {len(analysis['oscillation_modes']) - 10} modos\n"
-        report += "\n"
+            parts.append(f"  ... e mais {len(analysis['oscillation_modes']) - 10} modos\n")
+        parts.append("\n")
         
         if analysis['rotation']['detected']:
             rot = analysis['rotation']
-            report += "🌀 ROTAÇÃO ESTELAR DETECTADA:\n"
-            report += "-"*70 + "\n"
-            report += f"  Divisão rotacional:   {rot['rotational_splitting_uHz']:.3f} μHz\n"
-            report += f"  Período de rotação:   {rot['rotation_period_days']:.1f} dias\n\n"
+            parts.append("🌀 ROTAÇÃO ESTELAR DETECTADA:\n")
+            parts.append("-"*70 + "\n")
+            parts.append(f"  Divisão rotacional:   {rot['rotational_splitting_uHz']:.3f} μHz\n")
+            parts.append(f"  Período de rotação:   {rot['rotation_period_days']:.1f} dias\n\n")
         
         metrics = analysis['quality_metrics']
-        report += f"✓ QUALIDADE DA ANÁLISE: {metrics['quality_flag']}\n"
-        report += f"  SNR: {metrics['signal_to_noise']:.1f}\n\n"
+        parts.append(f"✓ QUALIDADE DA ANÁLISE: {metrics['quality_flag']}\n")
+        parts.append(f"  SNR: {metrics['signal_to_noise']:.1f}\n\n")
         
-        report += "="*70 + "\n"
-        return report
+        parts.append("="*70 + "\n")
+        return ''.join(parts)